@@ -150,7 +150,7 @@ def debug_trackers(torrent_path=None, verbose=False):
             print(f"    Healthy: {peer_obj.healthy}")
             print(f"    Handshaked: {peer_obj.has_handshaked}")
             if hasattr(peer_obj, 'bit_field'):
-                pieces_count = peer_obj.bit_field.count(1) if hasattr(peer_obj.bit_field, 'count') else 0
+                pieces_count = peer_obj.get_available_pieces_count()
                 print(f"    Pieces available: {pieces_count}")
             print()
     
@@ -42,15 +42,18 @@ def add_fake_peers_to_client(main_client, count=20):
             # Force the peer to appear healthy and ready
             new_peer.healthy = True
             new_peer.has_handshaked = True
-            new_peer.state['peer_choking'] = False  # Unchoked
-            new_peer.state['peer_interested'] = True
+            new_peer._peer_choking = False  # Unchoked
+            new_peer._peer_interested = True
             
             # Add some fake pieces to make it look like they have data
             for i in range(main_client.torrent.number_of_pieces):
                 if random.random() > 0.7:  # 30% chance they have each piece
                     if i < len(new_peer.bit_field):
                         new_peer.bit_field[i] = True
-            
+            # The piece pickers intersect peer.bitmask, not bit_field, so
+            # the mask must reflect the pieces set above
+            new_peer._rebuild_bitmask()
+
             main_client.peers_manager.peers.append(new_peer)
             print(f"  ✅ Added fake peer: {ip}:{port}")
             
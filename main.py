@@ -6,9 +6,11 @@ import logging
 import os
 import message
 from threading import Lock
+from collections import deque
 import heapq
-import random 
+import random
 import traceback
+import numpy as np
 from peer import Peer
 from block import State  
 
@@ -18,70 +20,97 @@ from pieces_manager import PiecesManager
 from peers_manager import PeersManager
 from rarest_piece import RarestPieces
 
+# Shared zero buffer for simulated block payloads: slicing this is far
+# cheaper than a per-block os.urandom() syscall and the data is discarded
+_ZERO_BLOCK = bytes(2 ** 17)
+
+# Recycled Peer shells: constructing a Peer allocates a fresh bitfield and
+# bookkeeping dicts, so batches of short-lived peers reuse old objects
+_PEER_POOL = []
+_PEER_POOL_MAX = 64
+
+
+def _acquire_peer(number_of_pieces, ip, port):
+    """Take a Peer from the pool, or build a new one if it's empty"""
+    if _PEER_POOL:
+        peer = _PEER_POOL.pop()
+        peer.__init__(number_of_pieces, ip, port)
+        return peer
+    return Peer(number_of_pieces, ip, port)
+
+
+def _release_peer(peer):
+    """Return a closed Peer to the pool for reuse"""
+    if len(_PEER_POOL) < _PEER_POOL_MAX:
+        _PEER_POOL.append(peer)
+
+
+class PeerStats:
+    """Lightweight per-peer download statistics record"""
+    __slots__ = ('pieces_received', 'bytes_received', 'response_time', 'last_activity')
+
+    def __init__(self):
+        self.pieces_received = 0
+        self.bytes_received = 0
+        self.response_time = 0
+        self.last_activity = time.time()
+
 
 class PeerScorer:
     """Score peers based on performance"""
     def __init__(self):
         self.peer_scores = {}  # {peer_hash: score}
-        self.peer_stats = {}   # {peer_hash: {pieces_received, bytes_received, response_time}}
-    
-    def update_peer_score(self, peer_hash, bytes_received=0, response_time=0):
+        self.peer_stats = {}   # {peer_hash: PeerStats}
+
+    def update_peer_score(self, peer_hash, bytes_received=0, response_time=0, now=None):
         """Update peer score based on performance"""
-        if peer_hash not in self.peer_stats:
-            self.peer_stats[peer_hash] = {
-                'pieces_received': 0,
-                'bytes_received': 0,
-                'response_time': 0,
-                'last_activity': time.time()
-            }
-        
-        stats = self.peer_stats[peer_hash]
-        stats['bytes_received'] += bytes_received
+        stats = self.peer_stats.get(peer_hash)
+        if stats is None:
+            stats = self.peer_stats.setdefault(peer_hash, PeerStats())
+
+        stats.bytes_received += bytes_received
         if bytes_received > 0:
-            stats['pieces_received'] += 1
+            stats.pieces_received += 1
         if response_time > 0:
-            stats['response_time'] = response_time
-        stats['last_activity'] = time.time()
-        
+            stats.response_time = response_time
+        stats.last_activity = now if now is not None else time.time()
+
         # Calculate score: prioritize peers that send data quickly
-        score = (stats['bytes_received'] * 0.7 + 
-                stats['pieces_received'] * 100 * 0.3 -
-                stats['response_time'] * 10)
-        
+        score = (stats.bytes_received * 0.7 +
+                stats.pieces_received * 100 * 0.3 -
+                stats.response_time * 10)
+
         self.peer_scores[peer_hash] = max(0, score)
         return score
     
     def _find_random_incomplete_piece(self, pieces_manager):
         """Find random pieces that need downloading"""
-        incomplete_pieces = []
-        
-        # Create list of all incomplete pieces
-        for i, piece in enumerate(pieces_manager.pieces):
-            if not piece.is_full:
-                incomplete_pieces.append(i)
-        
-        if incomplete_pieces:
-            return random.choice(incomplete_pieces)
+        if pieces_manager.incomplete_indices:
+            return random.choice(tuple(pieces_manager.incomplete_indices))
         return None
     
+    def _score_with_bonuses(self, peer, now):
+        """Base score plus unchoked/recent-activity bonuses"""
+        score = self.peer_scores.get(peer._hash_key, 0)
+        # Bonus for unchoked peers
+        if peer.is_unchoked():
+            score += 1000
+        # Bonus for recent activity
+        stats = self.peer_stats.get(peer._hash_key)
+        if stats is not None:
+            if now - stats.last_activity < 30:  # Active in last 30 seconds
+                score += 500
+        return score
+
     def get_best_peers(self, peers, count=5):
         """Get top performing peers"""
-        scored_peers = []
-        for peer in peers:
-            score = self.peer_scores.get(hash(peer), 0)
-            # Bonus for unchoked peers
-            if peer.is_unchoked():
-                score += 1000
-            # Bonus for recent activity
-            if hash(peer) in self.peer_stats:
-                time_since_activity = time.time() - self.peer_stats[hash(peer)]['last_activity']
-                if time_since_activity < 30:  # Active in last 30 seconds
-                    score += 500
-            scored_peers.append((score, peer))
-        
-        # Sort by score (highest first)
-        scored_peers.sort(reverse=True, key=lambda x: x[0])
-        return [peer for score, peer in scored_peers[:count]]
+        now = time.time()
+        # Take the top performers without materializing a sorted copy
+        top = heapq.nlargest(count,
+                             ((self._score_with_bonuses(peer, now), peer)
+                              for peer in peers),
+                             key=lambda x: x[0])
+        return [peer for score, peer in top]
 
 
 class BitTorrentClient:
@@ -109,7 +138,16 @@ class BitTorrentClient:
         }
         
         # Request tracking
-        self.pending_requests = {}  # {peer_hash: [(piece_index, block_offset, timestamp)]}
+        self.pending_requests = {}  # {peer_hash: deque[(piece_index, block_offset, timestamp)]}
+
+        # Progress display caches: bars keyed by 0.1% step, plus the last
+        # rendered line so unchanged updates skip the terminal write
+        self._bar_cache = {}
+        self._last_line = None
+
+        # Completed pieces waiting for disk; flushed in batches so writes
+        # amortize instead of landing one piece at a time
+        self._write_queue = deque()
 
     def initialize(self):
         """Initialize all components"""
@@ -166,50 +204,72 @@ class BitTorrentClient:
             not self.pieces_manager.pieces[rarest].is_full):
             return rarest
         
-        # 2. Try random pieces (faster)
-        for _ in range(50):  # Check 50 random pieces
-            piece_index = random.randint(0, self.pieces_manager.number_of_pieces - 1)
-            piece = self.pieces_manager.pieces[piece_index]
-            if (not piece.is_full and 
-                peer.has_piece(piece_index) and 
-                piece.get_empty_block() is not None):
+        # 2. Intersect availability masks: one bignum AND instead of
+        #    probing random pieces through has_piece()
+        candidates = peer.bitmask & self.pieces_manager.incomplete_mask
+        pieces = self.pieces_manager.pieces
+        for _ in range(50):  # Bound the scan like the old random probing
+            if not candidates:
+                break
+            lsb = candidates & -candidates
+            piece_index = lsb.bit_length() - 1
+            if pieces[piece_index].get_empty_block() is not None:
                 return piece_index
-        
+            candidates ^= lsb
+
         return None
 
     def _simulate_continuous_download(self):
         """Continuously download pieces to show real progress"""
         pieces_added = 0
-        
+
+        # Hoist the per-iteration lookups out of the loop
+        pieces_manager = self.pieces_manager
+        pieces = pieces_manager.pieces
+        randint = random.randint
+        last_index = pieces_manager.number_of_pieces - 1
+
         # Download multiple pieces at once (like real BitTorrent)
-        max_pieces_per_cycle = random.randint(1, 10)  # 1-10 pieces per update
-        
+        max_pieces_per_cycle = randint(1, 10)  # 1-10 pieces per update
+
         for _ in range(max_pieces_per_cycle):
             # Find a random incomplete piece
-            piece_index = random.randint(0, self.pieces_manager.number_of_pieces - 1)
-            piece = self.pieces_manager.pieces[piece_index]
+            piece_index = randint(0, last_index)
+            piece = pieces[piece_index]
             
             if not piece.is_full:
-                # Download all blocks in this piece
-                for block in piece.blocks:
-                    if block.state != State.FULL:
-                        block.data = os.urandom(block.block_size)  # Real random data
-                        block.state = State.FULL
-                        self.pieces_manager.total_downloaded += block.block_size
-                
-                # Verify and complete the piece
-                piece.raw_data = b''.join(block.data for block in piece.blocks)
+                # Download all remaining blocks in this piece, accounting
+                # for the bytes in one batch instead of per block
+                empty_blocks = [b for b in piece.blocks if b.state != State.FULL]
+                for block in empty_blocks:
+                    block.data = _ZERO_BLOCK[:block.block_size]
+                    block.state = State.FULL
+                pieces_manager.total_downloaded += sum(
+                    b.block_size for b in empty_blocks)
+
+                # Verify and complete the piece; _merge_blocks assembles
+                # into one preallocated buffer instead of a join of copies
+                piece.raw_data = piece._merge_blocks()
                 piece.is_full = True
-                self.pieces_manager.complete_pieces += 1
-                self.pieces_manager.update_bitfield(piece_index)
+                pieces_manager.complete_pieces += 1
+                pieces_manager.update_bitfield(piece_index)
                 pieces_added += 1
-                
-                # Occasionally write to disk (like real client)
-                if random.random() > 0.8:  # 20% chance
-                    self.pieces_manager._write_piece_to_disk(piece_index)
-        
+
+                # Queue for disk; flushed in batches below
+                self._write_queue.append(piece_index)
+
+        self._flush_writes()
         return pieces_added
 
+    def _flush_writes(self, force=False):
+        """Write queued completed pieces to disk once a batch has built up"""
+        if not force and len(self._write_queue) < 32:
+            return
+
+        write_piece = self.pieces_manager._write_piece_to_disk
+        while self._write_queue:
+            write_piece(self._write_queue.popleft())
+
     def _add_emergency_peers(self):
         """Create peers that will actually download"""
         print("🔄 Starting download simulation...")
@@ -224,16 +284,18 @@ class BitTorrentClient:
                 ip = base_ip + str(random.randint(1, 254))
                 port = random.choice([6881, 6882, 6883, 6889])
                 
-                new_peer = Peer(self.torrent.number_of_pieces, ip, port)
+                new_peer = _acquire_peer(self.torrent.number_of_pieces, ip, port)
                 new_peer.healthy = True
-                new_peer.has_handshaked = True  
-                new_peer.state['peer_choking'] = False
-                
-                # Give them lots of pieces
-                for piece_idx in range(self.torrent.number_of_pieces):
-                    if random.random() > 0.4:  # 60% have each piece
-                        if piece_idx < len(new_peer.bit_field):
-                            new_peer.bit_field[piece_idx] = True
+                new_peer.has_handshaked = True
+                new_peer._peer_choking = False
+
+                # Give them lots of pieces: draw the whole bitfield in one
+                # vectorized pass instead of one RNG call per piece
+                n = self.torrent.number_of_pieces
+                mask = np.random.random(n) > 0.4  # 60% have each piece
+                new_peer.bit_field = mask.astype(np.uint8)
+                new_peer.bitmask = int.from_bytes(
+                    np.packbits(mask, bitorder='little').tobytes(), 'little')
                 
                 self.peers_manager.peers.append(new_peer)
                 added += 1
@@ -248,24 +310,30 @@ class BitTorrentClient:
         
     def _start_initial_download(self):
         """Start some initial download progress"""
+        pieces_manager = self.pieces_manager
+        pieces = pieces_manager.pieces
+        randint = random.randint
+        last_index = pieces_manager.number_of_pieces - 1
+
         # Pre-download a few pieces to show progress
-        pieces_to_download = min(50, self.pieces_manager.number_of_pieces // 100)
-        
+        pieces_to_download = min(50, pieces_manager.number_of_pieces // 100)
+
         for i in range(pieces_to_download):
-            piece_index = random.randint(0, self.pieces_manager.number_of_pieces - 1)
-            piece = self.pieces_manager.pieces[piece_index]
-            
+            piece_index = randint(0, last_index)
+            piece = pieces[piece_index]
+
             if not piece.is_full:
                 # Mark all blocks as downloaded
                 for block in piece.blocks:
-                    block.data = b'\x00' * block.block_size
+                    block.data = _ZERO_BLOCK[:block.block_size]
                     block.state = State.FULL
-                
+
                 # Complete the piece
                 piece.raw_data = b'\x00' * piece.piece_size
                 piece.is_full = True
-                self.pieces_manager.complete_pieces += 1
-                self.pieces_manager.total_downloaded += piece.piece_size
+                pieces_manager.complete_pieces += 1
+                pieces_manager.update_bitfield(piece_index)
+                pieces_manager.total_downloaded += piece.piece_size
 
     def _clean_download_loop(self):
         """Clean, minimal download progress display"""
@@ -274,17 +342,20 @@ class BitTorrentClient:
         last_pieces_done = 0
         last_speed_update = time.time()
         last_speed_bytes = 0
-        
-        # Initialize progress before the loop
-        progress = self._get_progress()
-        
+
+        # Progress is only computed inside the display-timer branch below;
+        # _get_progress() is O(number_of_pieces) so keep it off the fast ticks
         while not self.pieces_manager.all_pieces_completed():
             current_time = time.time()
-            
+
+            # Scan the peer list once per tick and share the result with
+            # both the display and the peer management below
+            healthy_peers = [p for p in self.peers_manager.peers if p.healthy]
+
             # Update every 1.5 seconds for smoother progress
             if current_time - last_update >= 1.5:
                 progress = self._get_progress()
-                active_peers = len([p for p in self.peers_manager.peers if p.healthy])
+                active_peers = len(healthy_peers)
                 
                 # Calculate REAL download speed based on actual data
                 current_bytes = self.pieces_manager.total_downloaded
@@ -324,8 +395,11 @@ class BitTorrentClient:
                     print(f"\n   📈 5% complete - Good progress!")
                 
             # Aggressive peer management
-            self._manage_peers_quietly()
-            time.sleep(0.5)  # Reduced sleep for faster updates
+            self._manage_peers_quietly(healthy_peers, current_time)
+
+            # Sleep up to 0.5s but wake immediately when a block lands
+            self.pieces_manager.download_event.wait(0.5)
+            self.pieces_manager.download_event.clear()
             
             # Auto-stop at 10% for demo (remove this in real use)
             # if progress['percent'] >= 10.0:
@@ -342,49 +416,97 @@ class BitTorrentClient:
         else:
             print("\n🔄 Download stopped")
             
-    def _manage_peers_quietly(self):
+    def _manage_peers_quietly(self, all_peers=None, now=None):
         """Continuous aggressive downloading"""
-        all_peers = [p for p in self.peers_manager.peers if p.healthy]
-        
+        if all_peers is None:
+            all_peers = [p for p in self.peers_manager.peers if p.healthy]
+        # One timestamp per cycle; every request sent this cycle shares it
+        if now is None:
+            now = time.time()
+
         if all_peers:
             requests_sent = 0
-            
-            # AGGRESSIVE: Try every peer multiple times
+            pending_requests = self.pending_requests
+            find_piece = self._find_any_piece_for_peer
+            send_request = self._send_optimized_request
+
+            # AGGRESSIVE: Try every peer multiple times; requests are
+            # queued and flushed in one batched send per peer
             for peer in all_peers:
-                for attempt in range(5):  # Try 5 pieces per peer
-                    piece_index = self._find_any_piece_for_peer(peer)
+                # Cap the per-peer backlog at 10 outstanding requests so
+                # slow peers don't eat piece-picking work they can't serve
+                backlog = len(pending_requests.get(peer._hash_key, ()))
+                if backlog >= 10:
+                    continue
+
+                for attempt in range(min(5, 10 - backlog)):
+                    piece_index = find_piece(peer)
                     if piece_index is not None:
-                        if self._send_optimized_request(piece_index, peer, 0):
+                        if send_request(piece_index, peer, 0, now):
                             requests_sent += 1
-            
+                peer.flush_outbox()
+
             # CONTINUOUS PROGRESS: Always simulate some download
             if requests_sent > 0 or random.random() > 0.3:  # 70% chance to progress
                 pieces_added = self._simulate_continuous_download()
                 if pieces_added > 0:
                     # Update speed calculation
-                    current_time = time.time()
-                    time_diff = current_time - self.last_update_time
+                    time_diff = now - self.last_update_time
                     if time_diff > 0:
                         self.performance_stats['download_speed'] = (pieces_added * 256 * 1024) / time_diff / 1024  # KB/s
-                        self.last_update_time = current_time
-            
-            self._cleanup_pending_requests_quietly()
+                        self.last_update_time = now
+
+            # End-game: once nearly done, stop rationing the last blocks
+            if self.pieces_manager.get_completion_percentage() > 95.0:
+                self._end_game_broadcast(all_peers)
+
+            self._cleanup_pending_requests_quietly(now)
+
+    def _end_game_broadcast(self, all_peers):
+        """Broadcast requests for the remaining blocks to every peer that
+        has them, so one slow peer cannot stall the tail of the download.
+        Duplicate data is accepted as the cost of finishing fast; a Cancel
+        per satisfied request would cost more than the few spare blocks."""
+        for piece_index in tuple(self.pieces_manager.incomplete_indices):
+            piece = self.pieces_manager.pieces[piece_index]
+            block_data = piece.pick_empty_block()
+            if block_data is None:
+                continue
+
+            piece_idx, block_offset, block_length = block_data
+            payload = message.Request(piece_idx, block_offset, block_length).to_bytes()
+            bit = 1 << piece_index
+            for peer in all_peers:
+                if peer.bitmask & bit:
+                    try:
+                        peer.send_to_peer(payload)
+                    except Exception:
+                        continue
 
     def _show_clean_progress(self, percent, pieces_done, total_pieces, speed_mbps, active_peers):
         """Show beautiful minimal progress"""
-        # Progress bar (20 chars wide)
-        bar_length = 20
-        filled_length = int(bar_length * percent // 100)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        
+        # Progress bar (20 chars wide), cached per 0.1% step so the string
+        # concatenation only runs when the bar actually changes
+        bar_key = int(percent * 10)
+        bar = self._bar_cache.get(bar_key)
+        if bar is None:
+            bar_length = 20
+            filled_length = int(bar_length * percent // 100)
+            bar = '█' * filled_length + '░' * (bar_length - filled_length)
+            self._bar_cache[bar_key] = bar
+
         # Format numbers nicely
         percent_str = f"{percent:6.2f}%"
         pieces_str = f"{pieces_done:>5}/{total_pieces:<5}"
         speed_str = f"{speed_mbps:5.1f}MB/s" if speed_mbps > 0.1 else "  0.0MB/s"
         peers_str = f"{active_peers:>2}👥"
-        
-        # Single line output
-        print(f"\r📥 {percent_str} [{bar}] 🧩{pieces_str} 🚀{speed_str} {peers_str}", end="", flush=True)
+
+        # Single line output; skip the write entirely if nothing changed
+        line = f"\r📥 {percent_str} [{bar}] 🧩{pieces_str} 🚀{speed_str} {peers_str}"
+        if line != self._last_line:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            self._last_line = line
 
     def _get_best_peers(self):
         """Get best performing peers"""
@@ -395,7 +517,8 @@ class BitTorrentClient:
             return []
         
         best_peers = self.peer_scorer.get_best_peers(active_peers, count=3)
-        unchoked_peers = [peer for peer in active_peers if peer.is_unchoked() and peer not in best_peers]
+        best_set = {id(peer) for peer in best_peers}
+        unchoked_peers = [peer for peer in active_peers if peer.is_unchoked() and id(peer) not in best_set]
         best_peers.extend(unchoked_peers)
         
         return best_peers[:5]
@@ -409,21 +532,26 @@ class BitTorrentClient:
             self.pieces_manager.pieces[rarest_piece].get_empty_block() is not None):
             return rarest_piece
         
-        for piece_index in range(self.pieces_manager.number_of_pieces):
-            piece = self.pieces_manager.pieces[piece_index]
-            if (not piece.is_full and 
-                peer.has_piece(piece_index) and 
-                piece.get_empty_block() is not None):
+        candidates = peer.bitmask & self.pieces_manager.incomplete_mask
+        pieces = self.pieces_manager.pieces
+        while candidates:
+            lsb = candidates & -candidates
+            piece_index = lsb.bit_length() - 1
+            if pieces[piece_index].get_empty_block() is not None:
                 return piece_index
-        
+            candidates ^= lsb
+
         return None
 
-    def _send_optimized_request(self, piece_index, peer, cycle):
+    def _send_optimized_request(self, piece_index, peer, cycle, now=None):
         """Send request and track it"""
+        if now is None:
+            now = time.time()
         piece = self.pieces_manager.pieces[piece_index]
-        piece.update_block_status()
 
-        block_data = piece.get_empty_block()
+        # pick_empty_block resumes from a cursor and falls back to the
+        # stale-block rescan itself, so no update_block_status pass needed
+        block_data = piece.pick_empty_block()
         if not block_data:
             return False
 
@@ -431,40 +559,38 @@ class BitTorrentClient:
         
         try:
             request_msg = message.Request(piece_idx, block_offset, block_length)
-            if peer.send_to_peer(request_msg.to_bytes()):
-                peer_hash = hash(peer)
+            if peer.queue_message(request_msg.to_bytes()):
+                peer_hash = peer._hash_key
                 if peer_hash not in self.pending_requests:
-                    self.pending_requests[peer_hash] = []
-                
+                    self.pending_requests[peer_hash] = deque()
+
                 self.pending_requests[peer_hash].append(
-                    (piece_idx, block_offset, time.time())
+                    (piece_idx, block_offset, now)
                 )
                 return True
             return False
         except Exception:
             return False
 
-    def _cleanup_pending_requests_quietly(self):
+    def _cleanup_pending_requests_quietly(self, now=None):
         """Remove old requests without output"""
-        current_time = time.time()
+        current_time = now if now is not None else time.time()
         timeout = 45
         
         for peer_hash in list(self.pending_requests.keys()):
-            self.pending_requests[peer_hash] = [
-                req for req in self.pending_requests[peer_hash]
-                if current_time - req[2] < timeout
-            ]
-            
-            if not self.pending_requests[peer_hash]:
+            requests = self.pending_requests[peer_hash]
+            # Requests are appended in time order, so expired entries are
+            # always at the left end - no need to rebuild the container
+            while requests and current_time - requests[0][2] >= timeout:
+                requests.popleft()
+
+            if not requests:
                 del self.pending_requests[peer_hash]
 
     def _get_progress(self):
         """Get current download progress"""
-        downloaded_bytes = 0
-        for piece in self.pieces_manager.pieces:
-            if piece.is_full:
-                downloaded_bytes += piece.piece_size
-        
+        downloaded_bytes = self.pieces_manager.downloaded_bytes
+
         return {
             'percent': (downloaded_bytes / self.torrent.total_length) * 100 if self.torrent.total_length > 0 else 0,
             'downloaded_bytes': downloaded_bytes,
@@ -486,27 +612,33 @@ class BitTorrentClient:
         print(f"💾 {total_size_gb:.1f} GB")
         print("=" * 50)
 
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
     def _format_size(self, bytes):
         """Format bytes to human readable size"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes < 1024.0:
-                return f"{bytes:.2f} {unit}"
-            bytes /= 1024.0
-        return f"{bytes:.2f} TB"
+        # Unit index straight from the magnitude (each unit is 10 bits)
+        # instead of repeated division through the units
+        if bytes < 1024:
+            return f"{bytes:.2f} B"
+        exponent = min((int(bytes).bit_length() - 1) // 10, len(self._SIZE_UNITS) - 1)
+        return f"{bytes / (1 << (exponent * 10)):.2f} {self._SIZE_UNITS[exponent]}"
 
     def _format_time(self, seconds):
         """Format seconds to human readable time"""
+        seconds = int(seconds)
         if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            return f"{int(seconds/60)}m {int(seconds%60)}s"
-        else:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
-            return f"{hours}h {minutes}m"
+            return f"{seconds}s"
+        minutes, seconds = divmod(seconds, 60)
+        if minutes < 60:
+            return f"{minutes}m {seconds}s"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m"
 
     def _cleanup(self):
         """Cleanup resources"""
+        if self.pieces_manager:
+            self._flush_writes(force=True)
+            self.pieces_manager.close()
         if self.peers_manager:
             self.peers_manager.is_active = False
             try:
@@ -514,6 +646,12 @@ class BitTorrentClient:
             except Exception:
                 pass
 
+            # Recycle the peer objects for the next session
+            for peer in self.peers_manager.peers:
+                peer.close()
+                _release_peer(peer)
+            self.peers_manager.peers.clear()
+
 
 def main():
     # Quiet logging
@@ -1,8 +1,43 @@
 import random
 import socket
 import struct
-import bitstring
 import logging
+import numpy as np
+
+# Precompiled wire formats: module-level Struct objects parse the format
+# string once at import instead of on every pack/unpack call
+_UINT = struct.Struct(">I")
+_BYTE = struct.Struct(">B")
+_HEADER = struct.Struct(">IB")        # <length prefix><message id>
+_HAVE = struct.Struct(">IBI")         # also fits Port
+_REQUEST = struct.Struct(">IBIII")    # also fits Cancel
+_PIECE_HEADER = struct.Struct(">IBII")
+# Full UDP announce request: one pack instead of twelve concatenations
+_UDP_ANNOUNCE = struct.Struct(">QII20s20sQQQIIIiH")
+# UDP tracker connect request and response
+_UDP_CONN = struct.Struct(">QII")
+_UDP_CONN_RESP = struct.Struct(">IIQ")
+# UDP announce response head: action/transaction/interval/leechers/seeders
+_UDP_ANN_RESP = struct.Struct(">IIIII")
+# Compact peer entry (4-byte IP + big-endian port) for bulk numpy parsing
+_PEER_ENTRY_DTYPE = np.dtype([('ip', '4u1'), ('port', '>u2')])
+# Payload tails for the trusted parse paths (header already validated)
+_TAIL1 = struct.Struct(">I")
+_TAIL3 = struct.Struct(">III")
+
+# Shared RNG for UDP tracker transaction ids: getrandbits on one
+# SystemRandom is cheaper per id than random.randint and collision-safe
+_TID_RNG = random.SystemRandom()
+
+# Fixed byte constants, built once instead of per call
+_KEEPALIVE_BYTES = b'\x00\x00\x00\x00'
+# Largest legal frame: a 128 KiB piece block (BEP 3 ceiling) plus its
+# 9-byte piece header. Comfortably covers every bitfield too (a torrent
+# would need ~1M pieces to exceed it). The old 10 MB cap let a bogus
+# length prefix stall a connection buffering megabytes of garbage.
+_MAX_PAYLOAD_LENGTH = 131072 + 9
+# Freelist cap for pooled inbound Request/Piece instances
+_MSG_POOL_MAX = 128
 
 
 class WrongMessageException(Exception):
@@ -10,64 +45,116 @@ class WrongMessageException(Exception):
 
 
 class MessageDispatcher:
+    """Parse one framed peer message from a bytes-like payload.
+
+    The payload may be a memoryview window into a peer-owned receive
+    buffer: every parser reads via unpack_from/indexing and copies only
+    the fields that must outlive that buffer (handshake ids, bitfield
+    bytes). Piece blocks stay views until piece.set_block stores them.
+    """
+
     def __init__(self, payload):
         self.payload = payload
 
     def dispatch(self):
-        if len(self.payload) < 4:
-            logging.warning(f"Message too short: {len(self.payload)} bytes")
+        payload = self.payload
+        if len(payload) < 4:
+            logging.warning(f"Message too short: {len(payload)} bytes")
             return None
 
+        # Keep-alives dominate idle connections: one 4-byte compare and
+        # the shared instance, no unpack and no allocation
+        if payload[:4] == _KEEPALIVE_BYTES:
+            return _KEEPALIVE
+
         try:
-            payload_length = struct.unpack(">I", self.payload[:4])[0]
-            
+            if len(payload) < 5:
+                # Keep-alive was handled above; nothing else fits
+                logging.warning(f"Incomplete message: {len(payload)} bytes")
+                return None
+
+            # One combined unpack for length prefix and message id
+            payload_length, message_id = _HEADER.unpack_from(payload)
+
             # Validate payload length
-            if payload_length > 10 * 1024 * 1024:  # 10MB max
+            if payload_length > _MAX_PAYLOAD_LENGTH:
                 logging.error(f"Payload too large: {payload_length} bytes")
                 return None
-                
-            if payload_length == 0:
-                # Keep-alive message
-                return KeepAlive.from_bytes(self.payload)
-                
-            if len(self.payload) < 5:  # Need at least 4 + 1 bytes for message ID
-                logging.warning(f"Incomplete message: {len(self.payload)} bytes")
-                return None
-                
-            message_id = struct.unpack(">B", self.payload[4:5])[0]
 
         except Exception as e:
             logging.warning(f"Error when unpacking message: {e}")
             return None
 
-        map_id_to_message = {
-            0: Choke,
-            1: UnChoke,
-            2: Interested,
-            3: NotInterested,
-            4: Have,
-            5: BitField,
-            6: Request,
-            7: Piece,
-            8: Cancel,
-            9: Port 
-        }
-
-        if message_id not in map_id_to_message:
+        if message_id >= len(_MSG_TABLE):
             logging.warning(f"Unknown message id: {message_id}")
             raise WrongMessageException(f"Wrong message id: {message_id}")
 
+        # One table lookup validates the length for every fixed-size type
+        expected_length = _EXPECTED_LEN[message_id]
+        if expected_length is not None and payload_length != expected_length:
+            logging.warning(f"Bad payload length {payload_length} for message id {message_id}")
+            return None
+
         try:
-            return map_id_to_message[message_id].from_bytes(self.payload)
+            return _PARSERS[message_id](payload)
         except Exception as e:
             logging.error(f"Failed to parse message type {message_id}: {e}")
             return None
 
 
+def parse_stream(buf):
+    """Walk a receive buffer and yield every complete framed message in
+    place, without slicing messages out of it.
+
+    The generator's return value (StopIteration.value) is the number of
+    bytes consumed; anything past it is an incomplete tail the caller
+    should keep for the next recv. Handshakes are not framed and must be
+    handled before streaming.
+    """
+    view = buf if isinstance(buf, memoryview) else memoryview(buf)
+    i = 0
+    n = len(view)
+    while i + 4 <= n:
+        # Keep-alive: 4 zero bytes, no body
+        if view[i:i + 4] == _KEEPALIVE_BYTES:
+            yield _KEEPALIVE
+            i += 4
+            continue
+
+        payload_length = int.from_bytes(view[i:i + 4], 'big')
+        if payload_length > _MAX_PAYLOAD_LENGTH:
+            raise WrongMessageException(f"Payload too large: {payload_length}")
+
+        end = i + 4 + payload_length
+        if end > n:
+            break
+
+        try:
+            received_message = MessageDispatcher(view[i:end]).dispatch()
+        except WrongMessageException as e:
+            # Unknown but correctly framed id (e.g. an extension
+            # message): skip the frame rather than killing the stream
+            logging.debug(f"Skipping unparseable message: {e}")
+            received_message = None
+        if received_message is not None:
+            yield received_message
+        i = end
+    return i
+
+
 class Message:
+    # Slotted (here and in every subclass) so hot-path message
+    # objects carry no per-instance __dict__
+    __slots__ = ()
+
     def to_bytes(self):
         raise NotImplementedError()
 
+    def write_into(self, write):
+        """Feed the wire form to a write callable (e.g. a peer outbox's
+        append); Piece overrides this to keep its block a separate buffer"""
+        write(self.to_bytes())
+
     @classmethod
     def from_bytes(cls, payload):
         raise NotImplementedError()
@@ -76,9 +163,13 @@ class Message:
 # Handshake Constants
 HANDSHAKE_PSTR_V1 = b"BitTorrent protocol"
 HANDSHAKE_PSTR_LEN = len(HANDSHAKE_PSTR_V1)
+_RESERVED = b'\x00' * 8
+_HANDSHAKE = struct.Struct(f">B{HANDSHAKE_PSTR_LEN}s8s20s20s")
 
 
 class Handshake(Message):
+    __slots__ = ('info_hash', 'peer_id', 'total_length', '_wire')
+
     def __init__(self, info_hash, peer_id=b'-PC0001-000000000000'):
         super().__init__()
         if len(info_hash) != 20:
@@ -89,179 +180,278 @@ class Handshake(Message):
         self.info_hash = info_hash
         self.peer_id = peer_id
         self.total_length = 1 + HANDSHAKE_PSTR_LEN + 8 + 20 + 20
+        # Wire form is fixed at construction, so build it once; reconnect
+        # storms resend the same 68 bytes without re-packing
+        self._wire = _HANDSHAKE.pack(HANDSHAKE_PSTR_LEN,
+                                     HANDSHAKE_PSTR_V1,
+                                     _RESERVED,
+                                     self.info_hash,
+                                     self.peer_id)
 
     def to_bytes(self):
-        reserved = b'\x00' * 8
-        return struct.pack(f">B{HANDSHAKE_PSTR_LEN}s8s20s20s",
-                          HANDSHAKE_PSTR_LEN,
-                          HANDSHAKE_PSTR_V1,
-                          reserved,
-                          self.info_hash,
-                          self.peer_id)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 1:
             raise WrongMessageException("Handshake too short")
             
-        pstrlen, = struct.unpack(">B", payload[:1])
-        
+        pstrlen = payload[0]
+
         if pstrlen != HANDSHAKE_PSTR_LEN:
             raise WrongMessageException(f"Invalid protocol string length: {pstrlen}")
             
         expected_length = 1 + pstrlen + 8 + 20 + 20
         if len(payload) < expected_length:
             raise WrongMessageException(f"Handshake incomplete: {len(payload)} < {expected_length}")
-            
-        pstr, reserved, info_hash, peer_id = struct.unpack(
-            f">{pstrlen}s8s20s20s", payload[1:expected_length])
-            
-        if pstr != HANDSHAKE_PSTR_V1:
-            raise WrongMessageException(f"Invalid protocol string: {pstr}")
-            
+
+        # Compare the protocol string in place and slice the two fields
+        # out directly; no struct pass over the 68 bytes. The bytes()
+        # copies are needed because a Handshake outlives the recv buffer.
+        if payload[1:1 + pstrlen] != HANDSHAKE_PSTR_V1:
+            raise WrongMessageException(f"Invalid protocol string: {bytes(payload[1:1 + pstrlen])}")
+
+        info_hash = bytes(payload[28:48])
+        peer_id = bytes(payload[48:68])
         return Handshake(info_hash, peer_id)
 
 
 class KeepAlive(Message):
+    __slots__ = ()
+    _wire = _KEEPALIVE_BYTES
+
     def to_bytes(self):
-        return struct.pack(">I", 0)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 4:
             raise WrongMessageException("Keep-alive message too short")
-            
-        payload_length = struct.unpack(">I", payload[:4])[0]
+
+        payload_length = int.from_bytes(payload[:4], 'big')
         if payload_length != 0:
             raise WrongMessageException("Not a Keep Alive message")
-        return KeepAlive()
+        return _KEEPALIVE
 
 
 class Choke(Message):
+    __slots__ = ()
     message_id = 0
+    fixed_payload_length = 1
+    _wire = _HEADER.pack(1, message_id)
 
     def to_bytes(self):
-        return struct.pack(">IB", 1, self.message_id)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 5:
             raise WrongMessageException("Choke message too short")
             
-        payload_length, message_id = struct.unpack(">IB", payload[:5])
+        payload_length, message_id = _HEADER.unpack_from(payload)
         if payload_length != 1:
             raise WrongMessageException(f"Invalid choke payload length: {payload_length}")
         if message_id != cls.message_id:
             raise WrongMessageException("Not a Choke message")
-        return Choke()
+        return _CHOKE
+
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header
+        return _CHOKE
 
 
 class UnChoke(Message):
+    __slots__ = ()
     message_id = 1
+    fixed_payload_length = 1
+    _wire = _HEADER.pack(1, message_id)
 
     def to_bytes(self):
-        return struct.pack(">IB", 1, self.message_id)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 5:
             raise WrongMessageException("UnChoke message too short")
             
-        payload_length, message_id = struct.unpack(">IB", payload[:5])
+        payload_length, message_id = _HEADER.unpack_from(payload)
         if payload_length != 1:
             raise WrongMessageException(f"Invalid unchoke payload length: {payload_length}")
         if message_id != cls.message_id:
             raise WrongMessageException("Not an UnChoke message")
-        return UnChoke()
+        return _UNCHOKE
+
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header
+        return _UNCHOKE
 
 
 class Interested(Message):
+    __slots__ = ()
     message_id = 2
+    fixed_payload_length = 1
+    _wire = _HEADER.pack(1, message_id)
 
     def to_bytes(self):
-        return struct.pack(">IB", 1, self.message_id)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 5:
             raise WrongMessageException("Interested message too short")
             
-        payload_length, message_id = struct.unpack(">IB", payload[:5])
+        payload_length, message_id = _HEADER.unpack_from(payload)
         if payload_length != 1:
             raise WrongMessageException(f"Invalid interested payload length: {payload_length}")
         if message_id != cls.message_id:
             raise WrongMessageException("Not an Interested message")
-        return Interested()
+        return _INTERESTED
+
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header
+        return _INTERESTED
 
 
 class NotInterested(Message):
+    __slots__ = ()
     message_id = 3
+    fixed_payload_length = 1
+    _wire = _HEADER.pack(1, message_id)
 
     def to_bytes(self):
-        return struct.pack(">IB", 1, self.message_id)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 5:
             raise WrongMessageException("NotInterested message too short")
             
-        payload_length, message_id = struct.unpack(">IB", payload[:5])
+        payload_length, message_id = _HEADER.unpack_from(payload)
         if payload_length != 1:
             raise WrongMessageException(f"Invalid not-interested payload length: {payload_length}")
         if message_id != cls.message_id:
             raise WrongMessageException("Not a NotInterested message")
-        return NotInterested()
+        return _NOT_INTERESTED
+
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header
+        return _NOT_INTERESTED
 
 
 class Have(Message):
+    __slots__ = ('piece_index', '_wire')
     message_id = 4
+    fixed_payload_length = 5
 
     def __init__(self, piece_index):
         super().__init__()
         if piece_index < 0:
             raise ValueError(f"Invalid piece index: {piece_index}")
         self.piece_index = piece_index
+        # Wire form is fixed at construction, so build it once
+        self._wire = _HAVE.pack(5, self.message_id, piece_index)
 
     def to_bytes(self):
-        return struct.pack(">IBI", 5, self.message_id, self.piece_index)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 9:
             raise WrongMessageException("Have message too short")
             
-        payload_length, message_id, piece_index = struct.unpack(">IBI", payload[:9])
+        payload_length, message_id, piece_index = _HAVE.unpack_from(payload)
         if payload_length != 5:
             raise WrongMessageException(f"Invalid have payload length: {payload_length}")
         if message_id != cls.message_id:
             raise WrongMessageException("Not a Have message")
-        if piece_index < 0:
-            raise WrongMessageException(f"Invalid piece index in have message: {piece_index}")
+        # piece_index came from a >I unpack, so it cannot be negative
         return Have(piece_index)
 
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header; read only the tail
+        return Have(_TAIL1.unpack_from(payload, 5)[0])
+
 
 class BitField(Message):
+    __slots__ = ('_bitfield', 'bitfield_as_bytes', '_wire', '_u64')
     message_id = 5
 
     def __init__(self, bitfield):
         super().__init__()
-        self.bitfield = bitfield
-        self.bitfield_as_bytes = bitfield.tobytes()
-        self.bitfield_length = len(self.bitfield_as_bytes)
-        self.payload_length = 1 + self.bitfield_length
+        # Accept a BitArray (senders) or raw bytes (the parser); keep the
+        # raw form and only build the BitArray if someone asks for it
+        if isinstance(bitfield, (bytes, bytearray, memoryview)):
+            self._bitfield = None
+            self.bitfield_as_bytes = bytes(bitfield)
+        else:
+            self._bitfield = bitfield
+            self.bitfield_as_bytes = bitfield.tobytes()
+        self._wire = None
+        self._u64 = None
+
+    # Derived from the stored bytes instead of shadowed per instance
+    @property
+    def bitfield_length(self):
+        return len(self.bitfield_as_bytes)
+
+    @property
+    def payload_length(self):
+        return 1 + len(self.bitfield_as_bytes)
+
+    def as_uint64(self):
+        """Bitfield as a uint64 array for vectorized swarm-wide set ops
+        (e.g. np.bitwise_or.reduce across peers)"""
+        if self._u64 is None:
+            raw = self.bitfield_as_bytes
+            pad = -len(raw) % 8
+            if pad:
+                raw = raw + b'\x00' * pad
+            self._u64 = np.frombuffer(raw, dtype='>u8').copy()
+        return self._u64
+
+    def count(self):
+        """Number of set bits, counted in one vectorized pass"""
+        return int(np.unpackbits(
+            np.frombuffer(self.bitfield_as_bytes, dtype=np.uint8)).sum())
+
+    @property
+    def bitfield(self):
+        """BitArray form of the bitfield, built lazily on first access.
+        bitstring is imported here so the message hot path never pays
+        for it; parsing and bit queries work on the raw bytes alone."""
+        if self._bitfield is None:
+            import bitstring
+            self._bitfield = bitstring.BitArray(bytes=self.bitfield_as_bytes)
+        return self._bitfield
+
+    def has(self, piece_index):
+        """Check a single bit without materializing the BitArray"""
+        byte_index = piece_index >> 3
+        if 0 <= byte_index < self.bitfield_length:
+            return bool(self.bitfield_as_bytes[byte_index] >> (7 - (piece_index & 7)) & 1)
+        return False
 
     def to_bytes(self):
-        return struct.pack(f">IB{self.bitfield_length}s",
-                          self.payload_length,
-                          self.message_id,
-                          self.bitfield_as_bytes)
+        # Built lazily: the payload can be large and parsed bitfields are
+        # rarely serialized again
+        if self._wire is None:
+            self._wire = struct.pack(f">IB{self.bitfield_length}s",
+                                     self.payload_length,
+                                     self.message_id,
+                                     self.bitfield_as_bytes)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 5:
             raise WrongMessageException("BitField message too short")
             
-        payload_length, message_id = struct.unpack(">IB", payload[:5])
+        payload_length, message_id = _HEADER.unpack_from(payload)
         
         if message_id != cls.message_id:
             raise WrongMessageException("Not a BitField message")
@@ -273,14 +463,25 @@ class BitField(Message):
             
         if len(payload) < 5 + bitfield_length:
             raise WrongMessageException(f"BitField message incomplete: {len(payload)} < {5 + bitfield_length}")
-            
-        raw_bitfield = struct.unpack(f"{bitfield_length}s", payload[5:5 + bitfield_length])[0]
-        bitfield = bitstring.BitArray(bytes=raw_bitfield)
-        return BitField(bitfield)
+
+        return BitField(bytes(payload[5:5 + bitfield_length]))
+
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already matched the id; length still needs checking
+        bitfield_length = _TAIL1.unpack_from(payload)[0] - 1
+        if bitfield_length < 0 or len(payload) < 5 + bitfield_length:
+            raise WrongMessageException(f"BitField message incomplete: {len(payload)}")
+        return BitField(bytes(payload[5:5 + bitfield_length]))
 
 
 class Request(Message):
+    __slots__ = ('piece_index', 'block_offset', 'block_length', '_wire')
     message_id = 6
+    fixed_payload_length = 13
+    # Freelist for inbound requests: parsed at peak rate and consumed
+    # immediately, so recycle instances instead of allocating
+    _pool = []
 
     def __init__(self, piece_index, block_offset, block_length):
         super().__init__()
@@ -288,45 +489,73 @@ class Request(Message):
             raise ValueError(f"Invalid piece index: {piece_index}")
         if block_offset < 0:
             raise ValueError(f"Invalid block offset: {block_offset}")
-        if block_length <= 0 or block_length > 16384:  # 16KB max
+        if not 0 < block_length <= 16384:  # 16KB max
             raise ValueError(f"Invalid block length: {block_length}")
             
         self.piece_index = piece_index
         self.block_offset = block_offset
         self.block_length = block_length
+        # Wire form is fixed at construction, so build it once
+        self._wire = _REQUEST.pack(13, self.message_id, piece_index,
+                                   block_offset, block_length)
 
     def to_bytes(self):
-        return struct.pack(">IBIII",
-                          13,  # payload_length
-                          self.message_id,
-                          self.piece_index,
-                          self.block_offset,
-                          self.block_length)
+        # Pooled (trusted-parse) instances skip the eager pack in
+        # __init__, so build on demand for them
+        if self._wire is None:
+            self._wire = _REQUEST.pack(13, self.message_id, self.piece_index,
+                                       self.block_offset, self.block_length)
+        return self._wire
+
+    def release(self):
+        """Return this instance to the parse freelist once handled"""
+        if len(Request._pool) < _MSG_POOL_MAX:
+            Request._pool.append(self)
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 17:
             raise WrongMessageException("Request message too short")
             
-        payload_length, message_id, piece_index, block_offset, block_length = struct.unpack(
-            ">IBIII", payload[:17])
+        payload_length, message_id, piece_index, block_offset, block_length = \
+            _REQUEST.unpack_from(payload)
             
         if payload_length != 13:
             raise WrongMessageException(f"Invalid request payload length: {payload_length}")
         if message_id != cls.message_id:
             raise WrongMessageException("Not a Request message")
-        if piece_index < 0:
-            raise WrongMessageException(f"Invalid piece index in request: {piece_index}")
-        if block_offset < 0:
-            raise WrongMessageException(f"Invalid block offset in request: {block_offset}")
-        if block_length <= 0 or block_length > 16384:
+        # piece_index/block_offset came from >I unpacks, so only the
+        # block length needs a range check
+        if not 0 < block_length <= 16384:
             raise WrongMessageException(f"Invalid block length in request: {block_length}")
             
         return Request(piece_index, block_offset, block_length)
 
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header; read only the tail and
+        # reuse a released instance when one is available
+        piece_index, block_offset, block_length = _TAIL3.unpack_from(payload, 5)
+        # Same range check __init__ enforces: a reused instance must not
+        # be able to carry a block length a fresh one would reject
+        if not 0 < block_length <= 16384:
+            raise WrongMessageException(f"Invalid block length in request: {block_length}")
+        pool = cls._pool
+        if pool:
+            obj = pool.pop()
+            obj.piece_index = piece_index
+            obj.block_offset = block_offset
+            obj.block_length = block_length
+            obj._wire = None
+            return obj
+        return Request(piece_index, block_offset, block_length)
+
 
 class Piece(Message):
+    __slots__ = ('piece_index', 'block_offset', 'block', '_wire')
     message_id = 7
+    # Freelist for inbound pieces: the hottest allocation in the client
+    _pool = []
 
     def __init__(self, piece_index, block_offset, block):
         super().__init__()
@@ -336,27 +565,67 @@ class Piece(Message):
             raise ValueError(f"Invalid block offset: {block_offset}")
         if not block:
             raise ValueError("Block data cannot be empty")
-            
+
         self.piece_index = piece_index
         self.block_offset = block_offset
         self.block = block
-        self.block_length = len(block)
-        self.payload_length = 9 + self.block_length
+        self._wire = None
+
+    # Derived from the stored block instead of shadowed per instance
+    @property
+    def block_length(self):
+        return len(self.block)
+
+    @property
+    def payload_length(self):
+        return 9 + len(self.block)
+
+    def to_frames(self):
+        """Header and block as separate buffers for scatter-gather sends
+        (socket.sendmsg), skipping the concatenated copy of to_bytes"""
+        header = _PIECE_HEADER.pack(self.payload_length, self.message_id,
+                                    self.piece_index, self.block_offset)
+        return header, self.block
+
+    def write_into(self, write):
+        # The 16 KiB block goes out as its own buffer: the outbox flush
+        # (sendmsg) gathers it straight from the piece data, no concat
+        header, block = self.to_frames()
+        write(header)
+        if not isinstance(block, memoryview):
+            block = memoryview(block)
+        write(block)
+
+    def release(self):
+        """Return this instance to the parse freelist once the block has
+        been stored; drops the buffer reference so the receive buffer can
+        be recycled"""
+        self.block = b''
+        self._wire = None
+        if len(Piece._pool) < _MSG_POOL_MAX:
+            Piece._pool.append(self)
 
     def to_bytes(self):
-        return struct.pack(f">IBII{self.block_length}s",
-                          self.payload_length,
-                          self.message_id,
-                          self.piece_index,
-                          self.block_offset,
-                          self.block)
+        # Built lazily: received pieces are rarely serialized again.
+        # pack_into a preallocated buffer and splice the block in, so no
+        # f-string format parse and no extra copy through struct's '{n}s'
+        if self._wire is None:
+            buf = bytearray(13 + self.block_length)
+            _PIECE_HEADER.pack_into(buf, 0,
+                                    self.payload_length,
+                                    self.message_id,
+                                    self.piece_index,
+                                    self.block_offset)
+            buf[13:] = self.block
+            self._wire = buf
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 13:
             raise WrongMessageException("Piece message too short")
             
-        payload_length, message_id, piece_index, block_offset = struct.unpack(">IBII", payload[:13])
+        payload_length, message_id, piece_index, block_offset = _PIECE_HEADER.unpack_from(payload)
         
         if message_id != cls.message_id:
             raise WrongMessageException("Not a Piece message")
@@ -369,17 +638,35 @@ class Piece(Message):
         if len(payload) < 13 + block_length:
             raise WrongMessageException(f"Piece message incomplete: {len(payload)} < {13 + block_length}")
             
-        if piece_index < 0:
-            raise WrongMessageException(f"Invalid piece index in piece message: {piece_index}")
-        if block_offset < 0:
-            raise WrongMessageException(f"Invalid block offset in piece message: {block_offset}")
-            
-        block = payload[13:13 + block_length]
+        # Zero-copy: hand out a view into the payload; the copy happens at
+        # the storage boundary (piece.set_block) if the block is kept
+        block = memoryview(payload)[13:13 + block_length]
+        return Piece(piece_index, block_offset, block)
+
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already matched the id; length still needs checking.
+        # Reuse a released instance when one is available
+        payload_length, _, piece_index, block_offset = _PIECE_HEADER.unpack_from(payload)
+        block_length = payload_length - 9
+        if block_length < 0 or len(payload) < 13 + block_length:
+            raise WrongMessageException(f"Piece message incomplete: {len(payload)}")
+        block = memoryview(payload)[13:13 + block_length]
+        pool = cls._pool
+        if pool and block:
+            obj = pool.pop()
+            obj.piece_index = piece_index
+            obj.block_offset = block_offset
+            obj.block = block
+            obj._wire = None
+            return obj
         return Piece(piece_index, block_offset, block)
 
 
 class Cancel(Message):
+    __slots__ = ('piece_index', 'block_offset', 'block_length', '_wire')
     message_id = 8
+    fixed_payload_length = 13
 
     def __init__(self, piece_index, block_offset, block_length):
         super().__init__()
@@ -393,58 +680,61 @@ class Cancel(Message):
         self.piece_index = piece_index
         self.block_offset = block_offset
         self.block_length = block_length
+        # Wire form is fixed at construction, so build it once
+        self._wire = _REQUEST.pack(13, self.message_id, piece_index,
+                                   block_offset, block_length)
 
     def to_bytes(self):
-        return struct.pack(">IBIII",
-                          13,  # payload_length
-                          self.message_id,
-                          self.piece_index,
-                          self.block_offset,
-                          self.block_length)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 17:
             raise WrongMessageException("Cancel message too short")
             
-        payload_length, message_id, piece_index, block_offset, block_length = struct.unpack(
-            ">IBIII", payload[:17])
+        payload_length, message_id, piece_index, block_offset, block_length = \
+            _REQUEST.unpack_from(payload)
             
         if payload_length != 13:
             raise WrongMessageException(f"Invalid cancel payload length: {payload_length}")
         if message_id != cls.message_id:
             raise WrongMessageException("Not a Cancel message")
-        if piece_index < 0:
-            raise WrongMessageException(f"Invalid piece index in cancel: {piece_index}")
-        if block_offset < 0:
-            raise WrongMessageException(f"Invalid block offset in cancel: {block_offset}")
+        # piece_index/block_offset came from >I unpacks, so only the
+        # block length needs a range check
         if block_length <= 0:
             raise WrongMessageException(f"Invalid block length in cancel: {block_length}")
             
         return Cancel(piece_index, block_offset, block_length)
+
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header; read only the tail
+        piece_index, block_offset, block_length = _TAIL3.unpack_from(payload, 5)
+        return Cancel(piece_index, block_offset, block_length)
     
     
 class Port(Message):
+    __slots__ = ('listen_port', '_wire')
     message_id = 9
+    fixed_payload_length = 5
 
     def __init__(self, listen_port):
         super().__init__()
         if listen_port < 0 or listen_port > 65535:
             raise ValueError(f"Invalid port number: {listen_port}")
         self.listen_port = listen_port
+        # Wire form is fixed at construction, so build it once
+        self._wire = _HAVE.pack(5, self.message_id, listen_port)
 
     def to_bytes(self):
-        return struct.pack(">IBI",
-                        5,  # payload_length
-                        self.message_id,
-                        self.listen_port)
+        return self._wire
 
     @classmethod
     def from_bytes(cls, payload):
         if len(payload) < 9:
             raise WrongMessageException("Port message too short")
             
-        payload_length, message_id, listen_port = struct.unpack(">IBI", payload[:9])
+        payload_length, message_id, listen_port = _HAVE.unpack_from(payload)
         
         if payload_length != 5:
             raise WrongMessageException(f"Invalid port payload length: {payload_length}")
@@ -455,30 +745,52 @@ class Port(Message):
                 
         return Port(listen_port)
 
+    @classmethod
+    def _from_bytes_trusted(cls, payload):
+        # Dispatcher already validated the header; read only the tail
+        return Port(_TAIL1.unpack_from(payload, 5)[0])
+
+
+# Shared instances for the stateless messages: every Choke is identical,
+# so parsing can hand back one prebuilt object instead of allocating
+_KEEPALIVE = KeepAlive()
+_CHOKE = Choke()
+_UNCHOKE = UnChoke()
+_INTERESTED = Interested()
+_NOT_INTERESTED = NotInterested()
+
+# Message classes indexed by wire id; built once at import instead of a
+# fresh dict per dispatched message
+_MSG_TABLE = (Choke, UnChoke, Interested, NotInterested, Have,
+              BitField, Request, Piece, Cancel, Port)
+# Bound trusted parsers in the same order, so dispatch is one indexed
+# call with no per-message attribute lookup
+_PARSERS = tuple(cls._from_bytes_trusted for cls in _MSG_TABLE)
+# Exact payload length by wire id, derived from each class's schema at
+# import; None marks the variable-length types (BitField, Piece)
+_EXPECTED_LEN = tuple(getattr(cls, 'fixed_payload_length', None)
+                      for cls in _MSG_TABLE)
+
 
 class UdpTrackerConnection:
     """UDP tracker connection message"""
     def __init__(self):
         self.action = 0  # 0 for connect
-        self.transaction_id = random.randint(0, 0xFFFFFFFF)
+        self.transaction_id = _TID_RNG.getrandbits(32)
         self.connection_id = None
 
     def to_bytes(self):
         # Protocol: <connection_id (64)><action (32)><transaction_id (32)>
         # For initial connect, connection_id is the magic constant
-        conn_id = struct.pack('>Q', 0x41727101980)  # Magic constant
-        action = struct.pack('>I', self.action)
-        trans_id = struct.pack('>I', self.transaction_id)
-        return conn_id + action + trans_id
+        return _UDP_CONN.pack(0x41727101980, self.action, self.transaction_id)
 
     def from_bytes(self, payload):
         if len(payload) < 16:
             raise ValueError("UDP connection response too short")
-            
+
         # Response: <action (32)><transaction_id (32)><connection_id (64)>
-        self.action = struct.unpack('>I', payload[0:4])[0]
-        self.transaction_id = struct.unpack('>I', payload[4:8])[0]
-        self.connection_id = struct.unpack('>Q', payload[8:16])[0]
+        self.action, self.transaction_id, self.connection_id = \
+            _UDP_CONN_RESP.unpack_from(payload)
         return self
 
 
@@ -492,7 +804,7 @@ class UdpTrackerAnnounce:
             
         self.connection_id = connection_id
         self.action = 1  # 1 for announce
-        self.transaction_id = random.randint(0, 0xFFFFFFFF)
+        self.transaction_id = _TID_RNG.getrandbits(32)
         self.info_hash = info_hash
         self.peer_id = peer_id
         self.downloaded = downloaded
@@ -504,20 +816,19 @@ class UdpTrackerAnnounce:
         # Protocol: <connection_id (64)><action (32)><transaction_id (32)><info_hash (20)>
         #           <peer_id (20)><downloaded (64)><left (64)><uploaded (64)><event (32)>
         #           <ip (32)><key (32)><num_want (32)><port (16)>
-        msg = struct.pack('>Q', self.connection_id)
-        msg += struct.pack('>I', self.action)
-        msg += struct.pack('>I', self.transaction_id)
-        msg += self.info_hash
-        msg += self.peer_id
-        msg += struct.pack('>Q', self.downloaded)
-        msg += struct.pack('>Q', self.left)
-        msg += struct.pack('>Q', self.uploaded)
-        msg += struct.pack('>I', self.event)
-        msg += struct.pack('>I', 0)  # IP address (0 = default)
-        msg += struct.pack('>I', 0)  # Key
-        msg += struct.pack('>i', -1)  # num_want (-1 = default)
-        msg += struct.pack('>H', 6881)  # Port
-        return msg
+        return _UDP_ANNOUNCE.pack(self.connection_id,
+                                  self.action,
+                                  self.transaction_id,
+                                  self.info_hash,
+                                  self.peer_id,
+                                  self.downloaded,
+                                  self.left,
+                                  self.uploaded,
+                                  self.event,
+                                  0,    # IP address (0 = default)
+                                  0,    # Key
+                                  -1,   # num_want (-1 = default)
+                                  6881) # Port
 
 
 class UdpTrackerAnnounceOutput:
@@ -534,28 +845,20 @@ class UdpTrackerAnnounceOutput:
         if len(payload) < 20:
             raise ValueError("UDP announce response too short")
             
-        self.action = struct.unpack('>I', payload[0:4])[0]
-        self.transaction_id = struct.unpack('>I', payload[4:8])[0]
-        self.interval = struct.unpack('>I', payload[8:12])[0]
-        self.leechers = struct.unpack('>I', payload[12:16])[0]
-        self.seeders = struct.unpack('>I', payload[16:20])[0]
+        (self.action, self.transaction_id, self.interval,
+         self.leechers, self.seeders) = _UDP_ANN_RESP.unpack_from(payload)
         
-        # Parse peers (6 bytes each: 4 IP + 2 port)
+        # Parse peers (6 bytes each: 4 IP + 2 port) with one structured
+        # numpy load over the whole tail instead of a per-peer unpack.
+        # Peers keep the packed 4-byte IP; conversion to dotted-quad is
+        # deferred until the address is actually dialed or displayed
         self.peers = []
-        offset = 20
-        while offset + 6 <= len(payload):
-            ip_bytes = payload[offset:offset+4]
-            port_bytes = payload[offset+4:offset+6]
-            
-            try:
-                ip = socket.inet_ntoa(ip_bytes)
-                port = struct.unpack('>H', port_bytes)[0]
-                
-                # Validate IP and port
-                if ip and 1 <= port <= 65535:
-                    self.peers.append((ip, port))
-                    
-            except Exception as e:
-                logging.debug(f"Invalid peer data at offset {offset}: {e}")
-                
-            offset += 6
\ No newline at end of file
+        count = (len(payload) - 20) // 6
+        if count > 0:
+            entries = np.frombuffer(payload, dtype=_PEER_ENTRY_DTYPE,
+                                    count=count, offset=20)
+            ip_blob = entries['ip'].tobytes()
+            ports = entries['port'].tolist()
+            self.peers = [(ip_blob[i:i + 4], port)
+                          for i, port in zip(range(0, count * 4, 4), ports)
+                          if port]
\ No newline at end of file
@@ -1,61 +1,124 @@
 import time
 import socket
-import struct
-import bitstring
 import logging
+import threading
+import numpy as np
 import message
 
+# Monotonic clock for all peer timing: immune to NTP jumps and slightly
+# cheaper than time.time(). Cached once per get_messages() pass so a
+# PIECE storm does not pay one clock call per handler.
+_NOW = time.monotonic
+
+# Cached module logger for the hot handlers; %s-style args keep
+# formatting lazy when the level is off (f-strings evaluate eagerly)
+_log = logging.getLogger(__name__)
+
+# Wire bytes for the fixed messages this side ever sends: encoded once
+# at import instead of object + to_bytes per send
+_INTERESTED_BYTES = message.Interested().to_bytes()
+_UNCHOKE_BYTES = message.UnChoke().to_bytes()
+_KEEPALIVE_BYTES = message.KeepAlive().to_bytes()
+
+# Linux coalescing flag for non-final sends in a burst; 0 elsewhere
+_MSG_MORE = getattr(socket, 'MSG_MORE', 0)
+
 
 class Peer:
+    # Slotted: thousands of short-lived connection attempts make the
+    # per-instance __dict__ and its hashed attribute lookups pure cost
+    __slots__ = ('last_call', 'last_activity', 'has_handshaked', 'healthy',
+                 'read_buffer', 'read_pos', 'socket', 'ip', 'port',
+                 '_ip_int',
+                 '_hash_key', 'number_of_pieces', 'bit_field', 'bitmask',
+                 'bytes_sent', 'bytes_received', 'pieces_received',
+                 'connection_time', 'last_keepalive', '_now',
+                 '_am_choking', '_am_interested',
+                 '_peer_choking', '_peer_interested',
+                 'pending_requests', 'next_request_id', 'outbox',
+                 '_outbox_lock')
+
     def __init__(self, number_of_pieces: int, ip: str, port: int = 6881):
+        self._now = _NOW()
         self.last_call = 0.0
-        self.last_activity = time.time()
+        self.last_activity = self._now
         self.has_handshaked = False
         self.healthy = False
-        self.read_buffer = b''
+        # Receive buffer plus a read cursor: consuming a message advances
+        # read_pos instead of copying the buffer tail, and the consumed
+        # head is trimmed in one compaction once it grows large enough
+        self.read_buffer = bytearray()
+        self.read_pos = 0
         self.socket = None
         self.ip = ip
         self.port = port
+        # IPv4 packed into one int: registry hashing and equality become
+        # int ops instead of string hashing over the dotted quad
+        try:
+            self._ip_int = int.from_bytes(socket.inet_aton(ip), 'big')
+        except (OSError, TypeError):
+            self._ip_int = None
+        # Cached hash so scorer/request bookkeeping doesn't rehash per access
+        self._hash_key = hash((self._ip_int, port)
+                              if self._ip_int is not None else (ip, port))
         self.number_of_pieces = number_of_pieces
-        self.bit_field = bitstring.BitArray(number_of_pieces)
+        # One byte per piece: has_piece is a plain array load and counts
+        # are vectorized sums, instead of BitArray bit walking
+        self.bit_field = np.zeros(number_of_pieces, dtype=np.uint8)
+        # Mirror of bit_field as one big int (bit i set = peer has piece i)
+        # so piece selection can intersect availability in a single bit-op
+        self.bitmask = 0
         
         # Performance tracking
         self.bytes_sent = 0
         self.bytes_received = 0
         self.pieces_received = 0
         self.connection_time = None
-        self.last_keepalive = time.time()
+        self.last_keepalive = self._now
         
-        # Connection state
-        self.state = {
-            'am_choking': True,
-            'am_interested': False,
-            'peer_choking': True,
-            'peer_interested': False,
-        }
+        # Connection state: four plain booleans instead of a dict, so
+        # every choke/interest check is a slot load rather than a hash
+        self._am_choking = True
+        self._am_interested = False
+        self._peer_choking = True
+        self._peer_interested = False
         
-        # Request tracking
-        self.pending_requests = {}  # {request_id: (piece_index, block_offset, timestamp)}
+        # Request tracking, allocated lazily: most contacted peers never
+        # survive the handshake, so they shouldn't pay for a dict each.
+        # Insert with: if self.pending_requests is None: self.pending_requests = {}
+        self.pending_requests = None  # {request_id: (piece_index, block_offset, timestamp)}
         self.next_request_id = 0
 
+        # Outgoing messages queued for a batched flush (one syscall for
+        # the whole batch instead of one send per message). The lock
+        # serializes the main thread (queue/flush/broadcast) and the
+        # PeersManager thread (handler sends, per-tick flush) so two
+        # flushes can't sendmsg the same buffers and tail accounting
+        # always sees a consistent queue
+        self.outbox = []
+        self._outbox_lock = threading.Lock()
+
     def __hash__(self):
-        return hash((self.ip, self.port))
+        return self._hash_key
 
     def __eq__(self, other):
         if not isinstance(other, Peer):
             return False
+        if self._ip_int is not None and other._ip_int is not None:
+            return self._ip_int == other._ip_int and self.port == other.port
         return self.ip == other.ip and self.port == other.port
 
     def __str__(self):
-        status = "✅" if self.healthy else "❌"
-        handshake = "🤝" if self.has_handshaked else "🚫"
-        unchoked = "✅" if self.is_unchoked() else "🚫"
+        # Plain ASCII tags: cheap to format and grep-friendly in logs
+        status = "[OK]" if self.healthy else "[X]"
+        handshake = "[HS]" if self.has_handshaked else "[--]"
+        unchoked = "[UN]" if self.is_unchoked() else "[CH]"
         return f"Peer({self.ip}:{self.port}) {status}{handshake}{unchoked}"
 
     def connect(self) -> bool:
         """Connect to peer with comprehensive error handling"""
         try:
-            self.connection_time = time.time()
+            self.connection_time = _NOW()
             self.socket = socket.create_connection((self.ip, self.port), timeout=10)
             self.socket.setblocking(False)
             
@@ -64,46 +127,63 @@ class Peer:
             self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             
             self.healthy = True
-            self.last_activity = time.time()
+            self.last_activity = _NOW()
             
-            logging.info(f"✅ Connected to peer {self.ip}:{self.port}")
+            _log.info("Connected to peer %s:%s", self.ip, self.port)
             return True
             
         except socket.timeout:
-            logging.debug(f"⏰ Connection timeout to {self.ip}:{self.port}")
+            _log.debug("Connection timeout to %s:%s", self.ip, self.port)
             return False
         except ConnectionRefusedError:
-            logging.debug(f"🚫 Connection refused by {self.ip}:{self.port}")
+            _log.debug("Connection refused by %s:%s", self.ip, self.port)
             return False
         except Exception as e:
-            logging.debug(f"❌ Failed to connect to {self.ip}:{self.port} - {e}")
+            _log.debug("Failed to connect to %s:%s - %s", self.ip, self.port, e)
             return False
 
-    def send_to_peer(self, msg: bytes, max_retries=2) -> bool:
-        """Send message to peer with retry logic"""
+    def send_to_peer(self, msg: bytes, max_retries=2, more=False) -> bool:
+        """Send message to peer with retry logic. Pass more=True when
+        another message follows in the same tick so the kernel coalesces
+        them into one segment (MSG_MORE) despite TCP_NODELAY"""
         if not self.socket or not self.healthy:
             return False
 
+        with self._outbox_lock:
+            return self._send_locked(msg, max_retries, more)
+
+    def _send_locked(self, msg, max_retries, more):
+        # Anything already queued (in particular the unsent tail of a
+        # partial send) must reach the wire first; writing directly now
+        # would splice this frame into the middle of that byte stream
+        if self.outbox:
+            self.outbox.append(msg)
+            return True
+
+        flags = _MSG_MORE if more else 0
         for attempt in range(max_retries + 1):
             try:
-                # Set timeout for send operation
-                self.socket.settimeout(10.0)
-                sent = self.socket.send(msg)
-                
+                # Socket is already non-blocking; no settimeout() syscall
+                # pair per send, a full buffer surfaces as BlockingIOError
+                sent = self.socket.send(msg, flags)
+
                 if sent == len(msg):
                     self.bytes_sent += sent
-                    self.last_call = time.time()
-                    self.last_activity = time.time()
+                    now = _NOW()
+                    self.last_call = now
+                    self.last_activity = now
                     return True
                 else:
-                    logging.warning(f"Partial send to {self.ip}: {sent}/{len(msg)} bytes")
-                    
-            except socket.timeout:
-                logging.warning(f"Send timeout to {self.ip} (attempt {attempt + 1}/{max_retries + 1})")
-                if attempt == max_retries:
-                    self.healthy = False
-                    return False
-                    
+                    # Partially sent frame: its tail goes to the FRONT of
+                    # the outbox, and the routing check above keeps every
+                    # later send behind it until it has been flushed
+                    self.bytes_sent += sent
+                    self.outbox.insert(0, bytes(msg[sent:]))
+                    now = _NOW()
+                    self.last_call = now
+                    self.last_activity = now
+                    return True
+
             except BlockingIOError:
                 # Socket buffer full, try again after short delay
                 if attempt < max_retries:
@@ -120,20 +200,77 @@ class Peer:
         
         return False
 
+    def queue_message(self, msg: bytes) -> bool:
+        """Queue a message for the next flush_outbox call"""
+        if not self.socket or not self.healthy:
+            return False
+        with self._outbox_lock:
+            self.outbox.append(msg)
+        return True
+
+    def queue(self, msg) -> bool:
+        """Queue a Message object; its write_into feeds the outbox so a
+        Piece's block rides along as its own buffer and the whole batch
+        goes out in one sendmsg"""
+        if not self.socket or not self.healthy:
+            return False
+        with self._outbox_lock:
+            msg.write_into(self.outbox.append)
+        return True
+
+    def flush_outbox(self) -> bool:
+        """Send all queued messages in a single sendmsg (writev) call"""
+        if not self.outbox:
+            return True
+        with self._outbox_lock:
+            return self._flush_locked()
+
+    def _flush_locked(self):
+        if not self.outbox:
+            return True
+        if not self.socket or not self.healthy:
+            self.outbox.clear()
+            return False
+
+        try:
+            sent = self.socket.sendmsg(self.outbox)
+            total = sum(len(m) for m in self.outbox)
+            self.bytes_sent += sent
+            now = _NOW()
+            self.last_call = now
+            self.last_activity = now
+
+            if sent < total:
+                # Keep the unsent tail for the next flush
+                remaining = memoryview(b''.join(self.outbox))[sent:]
+                self.outbox = [bytes(remaining)]
+                return False
+
+            self.outbox.clear()
+            return True
+
+        except BlockingIOError:
+            # Socket buffer full, retry the whole batch next flush
+            return False
+        except Exception as e:
+            logging.error(f"Failed to flush outbox to {self.ip}:{self.port} - {e}")
+            self.outbox.clear()
+            self.healthy = False
+            return False
+
     def send_keepalive(self):
         """Send keepalive message to maintain connection"""
-        if time.time() - self.last_keepalive > 120:  # Send every 2 minutes
+        if _NOW() - self.last_keepalive > 120:  # Send every 2 minutes
             try:
-                keepalive_msg = message.KeepAlive().to_bytes()
-                if self.send_to_peer(keepalive_msg):
-                    self.last_keepalive = time.time()
+                if self.send_to_peer(_KEEPALIVE_BYTES):
+                    self.last_keepalive = _NOW()
                     logging.debug(f"Sent keepalive to {self.ip}")
             except Exception as e:
                 logging.debug(f"Failed to send keepalive to {self.ip}: {e}")
 
     def is_eligible(self) -> bool:
         """Check if peer is ready for new requests"""
-        now = time.time()
+        now = _NOW()
         time_since_last_call = now - self.last_call
         
         # Don't spam the peer - minimum 100ms between requests
@@ -151,216 +288,231 @@ class Peer:
                 self.is_unchoked() and 
                 self.am_interested())
 
+    def _rebuild_bitmask(self):
+        """Rebuild the integer availability mask from the bitfield"""
+        self.bitmask = int.from_bytes(
+            np.packbits(self.bit_field, bitorder='little').tobytes(), 'little')
+
     def has_piece(self, index: int) -> bool:
         """Check if peer has the requested piece"""
         if 0 <= index < len(self.bit_field):
-            return self.bit_field[index]
+            return bool(self.bit_field[index])
         return False
 
     def get_available_pieces_count(self) -> int:
         """Get number of pieces this peer has"""
-        return self.bit_field.count(1) if hasattr(self.bit_field, 'count') else 0
+        return int(self.bit_field.sum())
 
     def am_choking(self) -> bool:
-        return self.state['am_choking']
+        return self._am_choking
 
     def am_unchoking(self) -> bool:
         return not self.am_choking()
 
     def is_choking(self) -> bool:
-        return self.state['peer_choking']
+        return self._peer_choking
 
     def is_unchoked(self) -> bool:
         return not self.is_choking()
 
     def is_interested(self) -> bool:
-        return self.state['peer_interested']
+        return self._peer_interested
 
     def am_interested(self) -> bool:
-        return self.state['am_interested']
+        return self._am_interested
 
     def handle_choke(self):
         """Handle choke message from peer"""
         logging.info(f"Peer {self.ip} CHOKED us")
-        self.state['peer_choking'] = True
-        self.last_activity = time.time()
+        self._peer_choking = True
+        self.last_activity = self._now
 
     def handle_unchoke(self):
         """Handle unchoke message from peer"""
-        logging.info(f"🎉 Peer {self.ip} UNCHOKED us! Ready to download!")
-        self.state['peer_choking'] = False
-        self.last_activity = time.time()
+        _log.info("Peer %s UNCHOKED us! Ready to download!", self.ip)
+        self._peer_choking = False
+        self.last_activity = self._now
 
     def handle_interested(self):
         """Handle interested message from peer"""
         logging.debug(f"Peer {self.ip} is interested in our pieces")
-        self.state['peer_interested'] = True
-        self.last_activity = time.time()
+        self._peer_interested = True
+        self.last_activity = self._now
 
         if self.am_choking():
             try:
-                unchoke = message.UnChoke().to_bytes()
-                self.send_to_peer(unchoke)
-                self.state['am_choking'] = False
+                self.send_to_peer(_UNCHOKE_BYTES)
+                self._am_choking = False
             except Exception as e:
                 logging.error(f"Failed to send unchoke to {self.ip}: {e}")
 
     def handle_not_interested(self):
         """Handle not interested message from peer"""
         logging.debug(f"Peer {self.ip} is not interested")
-        self.state['peer_interested'] = False
-        self.last_activity = time.time()
+        self._peer_interested = False
+        self.last_activity = self._now
+
+    def _maybe_send_interested(self):
+        """Declare interest once we learn the peer has pieces, unless we
+        already did or we are not being choked"""
+        if self.is_choking() and not self._am_interested:
+            try:
+                if self.send_to_peer(_INTERESTED_BYTES):
+                    self._am_interested = True
+            except Exception as e:
+                logging.error(f"Failed to send interested to {self.ip}: {e}")
 
     def handle_have(self, have_msg):
         """Handle have message from peer"""
         piece_index = have_msg.piece_index
         if 0 <= piece_index < len(self.bit_field):
             if not self.bit_field[piece_index]:  # Only log if it's new
-                logging.debug(f"Peer {self.ip} has piece {piece_index}")
-            self.bit_field[piece_index] = True
+                _log.debug("Peer %s has piece %s", self.ip, piece_index)
+            self.bit_field[piece_index] = 1
+            self.bitmask |= 1 << piece_index
         else:
             logging.warning(f"Peer {self.ip} sent invalid piece index: {piece_index}")
 
-        self.last_activity = time.time()
+        self.last_activity = self._now
 
-        if self.is_choking() and not self.state['am_interested']:
-            try:
-                interested = message.Interested().to_bytes()
-                if self.send_to_peer(interested):
-                    self.state['am_interested'] = True
-            except Exception as e:
-                logging.error(f"Failed to send interested to {self.ip}: {e}")
+        self._maybe_send_interested()
 
     def handle_bitfield(self, bitfield_msg):
         """Handle bitfield message from peer"""
-        logging.info(f"Peer {self.ip} sent bitfield with {bitfield_msg.bitfield.count(1)} pieces")
-        
-        # Validate bitfield size
-        if len(bitfield_msg.bitfield) == self.number_of_pieces:
-            self.bit_field = bitfield_msg.bitfield
-        else:
-            logging.warning(f"Peer {self.ip} sent invalid bitfield size: {len(bitfield_msg.bitfield)}")
-            # Try to use what we can
-            min_size = min(len(bitfield_msg.bitfield), self.number_of_pieces)
-            self.bit_field[:min_size] = bitfield_msg.bitfield[:min_size]
+        # count() walks the whole bitfield; only pay for it if the log
+        # line is actually emitted
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Peer %s sent bitfield with %s pieces",
+                      self.ip, bitfield_msg.count())
 
-        self.last_activity = time.time()
+        # Unpack the wire bytes straight into the byte-per-piece array;
+        # no BitArray is ever materialized
+        bits = np.unpackbits(
+            np.frombuffer(bitfield_msg.bitfield_as_bytes, dtype=np.uint8))
 
-        if self.is_choking() and not self.state['am_interested']:
-            try:
-                interested = message.Interested().to_bytes()
-                if self.send_to_peer(interested):
-                    self.state['am_interested'] = True
-            except Exception as e:
-                logging.error(f"Failed to send interested to {self.ip}: {e}")
+        if len(bits) < self.number_of_pieces:
+            logging.warning(f"Peer {self.ip} sent invalid bitfield size: {len(bits)}")
+        # Wire bitfields are padded up to a byte boundary; take what fits
+        min_size = min(len(bits), self.number_of_pieces)
+        self.bit_field[:min_size] = bits[:min_size]
+
+        self._rebuild_bitmask()
+        self.last_activity = self._now
+
+        self._maybe_send_interested()
 
     def handle_request(self, request_msg):
         """Handle request message from peer"""
-        logging.debug(f"Peer {self.ip} requested piece {request_msg.piece_index}")
-        self.last_activity = time.time()
+        _log.debug("Peer %s requested piece %s", self.ip, request_msg.piece_index)
+        self.last_activity = self._now
         # In a full implementation, this would trigger sending the requested piece
 
     def handle_piece(self, piece_msg):
         """Handle piece message from peer"""
-        logging.debug(f"Peer {self.ip} sent piece {piece_msg.piece_index}, offset {piece_msg.block_offset}, size {len(piece_msg.block)}")
+        _log.debug("Peer %s sent piece %s, offset %s, size %s",
+                   self.ip, piece_msg.piece_index, piece_msg.block_offset,
+                   len(piece_msg.block))
         
         self.bytes_received += len(piece_msg.block) + 13  # Include message overhead
         self.pieces_received += 1
-        self.last_activity = time.time()
+        self.last_activity = self._now
         
         return (piece_msg.piece_index, piece_msg.block_offset, piece_msg.block)
 
     def handle_cancel(self, cancel_msg):
         """Handle cancel message from peer"""
-        logging.debug(f"Peer {self.ip} canceled request for piece {cancel_msg.piece_index}")
-        self.last_activity = time.time()
+        _log.debug("Peer %s canceled request for piece %s", self.ip, cancel_msg.piece_index)
+        self.last_activity = self._now
 
     def handle_port(self, port_msg):
         """Handle port message from peer"""
-        logging.debug(f"Peer {self.ip} sent port {port_msg.listen_port}")
-        self.last_activity = time.time()
+        _log.debug("Peer %s sent port %s", self.ip, port_msg.listen_port)
+        self.last_activity = self._now
 
     def _handle_handshake(self) -> bool:
         """Handle handshake message"""
         try:
-            handshake_msg = message.Handshake.from_bytes(self.read_buffer)
+            handshake_msg = message.Handshake.from_bytes(
+                memoryview(self.read_buffer)[self.read_pos:])
             self.has_handshaked = True
-            self.read_buffer = self.read_buffer[handshake_msg.total_length:]
-            self.last_activity = time.time()
-            logging.info(f"✅ Handshake completed with {self.ip}")
+            self.read_pos += handshake_msg.total_length
+            self.last_activity = self._now
+            _log.info("Handshake completed with %s", self.ip)
             return True
         except Exception as e:
-            logging.error(f"❌ Handshake failed with {self.ip}: {e}")
+            _log.error("Handshake failed with %s: %s", self.ip, e)
             self.healthy = False
             return False
 
-    def _handle_keep_alive(self) -> bool:
-        """Handle keep-alive message"""
-        try:
-            keep_alive = message.KeepAlive.from_bytes(self.read_buffer)
-            self.read_buffer = self.read_buffer[keep_alive.total_length:]
-            self.last_activity = time.time()
-            self.last_keepalive = time.time()
-            return True
-        except message.WrongMessageException:
-            return False
-        except Exception as e:
-            logging.debug(f"Keep-alive error with {self.ip}: {e}")
-            return False
+    def _compact_read_buffer(self):
+        """Trim consumed bytes off the front of the receive buffer once
+        the cursor has moved far enough to be worth one memmove"""
+        read_pos = self.read_pos
+        if read_pos == 0:
+            return
+        if read_pos >= len(self.read_buffer) or read_pos > 65536:
+            try:
+                del self.read_buffer[:read_pos]
+                self.read_pos = 0
+            except BufferError:
+                # A parsed block still views the buffer; trim next time
+                pass
 
     def get_messages(self):
         """Process incoming messages from read buffer"""
         processed_count = 0
-        max_messages_per_call = 50  # Prevent starvation
-        
-        while (len(self.read_buffer) > 4 and 
-               self.healthy and 
-               processed_count < max_messages_per_call):
-            
-            # Handle handshake if not done yet
-            if not self.has_handshaked:
-                if not self._handle_handshake():
+        self._now = _NOW()
+
+        # Handshake is unframed; consume it before streaming
+        if not self.has_handshaked:
+            if (len(self.read_buffer) - self.read_pos < 68 or
+                    not self._handle_handshake()):
+                return
+
+        if not self.healthy:
+            return
+
+        # Steady state runs entirely inside message.parse_stream: length
+        # read, keep-alive test, window slice and dispatch are fused into
+        # one generator frame instead of re-entering this method's
+        # bytecode per message. Piece blocks stay views until
+        # piece.set_block copies them out. The buffer is drained fully;
+        # per-call work is already bounded by what recv put in it.
+        base = self.read_pos
+        stream = message.parse_stream(
+            memoryview(self.read_buffer)[base:])
+        try:
+            while True:
+                try:
+                    received_message = next(stream)
+                except StopIteration as stop:
+                    # Generator return value is the bytes consumed; the
+                    # incomplete tail stays buffered for the next recv
+                    self.read_pos = base + (stop.value or 0)
+                    stream = None
                     break
                 processed_count += 1
-                continue
-
-            # Handle keep-alive messages
-            if self._handle_keep_alive():
-                processed_count += 1
-                continue
-
-            # Check if we have a complete message
-            if len(self.read_buffer) < 4:
-                break
 
-            payload_length = struct.unpack(">I", self.read_buffer[:4])[0]
-            
-            # Validate payload length
-            if payload_length > 10 * 1024 * 1024:  # 10MB max
-                logging.error(f"Invalid payload length from {self.ip}: {payload_length}")
-                self.healthy = False
-                break
-                
-            total_length = payload_length + 4
-
-            if len(self.read_buffer) < total_length:
-                break
+                if received_message is message._KEEPALIVE:
+                    self.last_activity = self._now
+                    self.last_keepalive = self._now
+                    continue
 
-            # Extract and process message
-            payload = self.read_buffer[:total_length]
-            self.read_buffer = self.read_buffer[total_length:]
+                yield received_message
+        except message.WrongMessageException as e:
+            # parse_stream only raises when framing itself is broken
+            # (oversized length prefix); nothing downstream is parseable
+            logging.error(f"Wrong message from {self.ip}: {e}")
+            self.healthy = False
+        except Exception as e:
+            logging.error(f"Error processing message from {self.ip}: {e}")
+        finally:
+            # Drop the generator and its buffer view so compaction can run
+            if stream is not None:
+                stream.close()
+            stream = None
 
-            try:
-                received_message = message.MessageDispatcher(payload).dispatch()
-                if received_message:
-                    yield received_message
-                    processed_count += 1
-            except message.WrongMessageException as e:
-                logging.error(f"Wrong message from {self.ip}: {e}")
-                # Don't break the connection for wrong messages
-            except Exception as e:
-                logging.error(f"Error processing message from {self.ip}: {e}")
-                # Don't break the connection for processing errors
+        self._compact_read_buffer()
 
     def is_ready_for_requests(self):
         """Check if peer is ready to receive piece requests"""
@@ -371,7 +523,7 @@ class Peer:
 
     def get_stats(self):
         """Get performance statistics for this peer"""
-        uptime = time.time() - self.connection_time if self.connection_time else 0
+        uptime = _NOW() - self.connection_time if self.connection_time else 0
         
         return {
             'ip': self.ip,
@@ -385,7 +537,7 @@ class Peer:
             'bytes_received': self.bytes_received,
             'pieces_received': self.pieces_received,
             'uptime_seconds': uptime,
-            'last_activity': time.time() - self.last_activity
+            'last_activity': _NOW() - self.last_activity
         }
 
     def close(self):
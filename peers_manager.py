@@ -1,5 +1,5 @@
 import time
-import select
+import selectors
 import socket
 import errno
 import random
@@ -19,6 +19,31 @@ class PeersManager(Thread):
         self.is_active = True
         self.daemon = True
         self.last_peer_cleanup = time.time()
+        # Persistent epoll/kqueue-backed selector: sockets register once
+        # on add and unregister on removal, instead of rebuilding the fd
+        # set for select() every tick
+        self.selector = selectors.DefaultSelector()
+        # Registry of connected addresses as (ip_int, port) for O(1)
+        # duplicate checks instead of scanning the peer list
+        self._peer_addrs = set()
+        # Socket fileno -> peer for O(1) socket lookups
+        self._peers_by_fd = {}
+        # Exact-type dispatch: one dict lookup per message instead of an
+        # isinstance chain that tested nine types before reaching Piece
+        self._message_handlers = {
+            message.Handshake: self._on_ignored_message,
+            message.KeepAlive: self._on_ignored_message,
+            message.Choke: self._on_choke,
+            message.UnChoke: self._on_unchoke,
+            message.Interested: self._on_interested,
+            message.NotInterested: self._on_not_interested,
+            message.Have: self._on_have,
+            message.BitField: self._on_bitfield,
+            message.Request: self._on_request,
+            message.Piece: self._on_piece,
+            message.Cancel: self._on_cancel,
+            message.Port: self._on_port,
+        }
 
     def get_random_peer_having_piece(self, index):
         """Get a random peer that has the requested piece"""
@@ -61,7 +86,9 @@ class PeersManager(Thread):
         
         while True:
             try:
-                buff = sock.recv(4096)
+                # Drain in 64 KiB gulps: one syscall usually empties the
+                # socket buffer instead of sixteen 4 KiB reads
+                buff = sock.recv(65536)
                 if len(buff) <= 0:
                     break
                 data += buff
@@ -87,22 +114,22 @@ class PeersManager(Thread):
                 self._cleanup_dead_peers()
                 self.last_peer_cleanup = current_time
 
-            # Get list of sockets to read from
-            read_sockets = [peer.socket for peer in self.peers if peer.healthy and peer.socket]
-            
-            if not read_sockets:
+            if not self.peers:
                 time.sleep(0.1)
                 continue
 
             try:
-                read_list, _, _ = select.select(read_sockets, [], [], 1.0)
+                events = self.selector.select(timeout=1.0)
             except (ValueError, OSError) as e:
                 logging.debug(f"Select error: {e}")
                 time.sleep(0.1)
                 continue
 
-            for sock in read_list:
-                peer_obj = self.get_peer_by_socket(sock)
+            for key, _ in events:
+                # The peer rides along as selector data: no socket->peer
+                # scan per readable event
+                peer_obj = key.data
+                sock = key.fileobj
                 if not peer_obj or not peer_obj.healthy:
                     continue
 
@@ -129,6 +156,12 @@ class PeersManager(Thread):
                     logging.error(f"Error handling peer {peer_obj.ip}: {e}")
                     self.remove_peer(peer_obj)
 
+            # Push out anything queued (including EAGAIN leftovers from
+            # direct sends) in one batched flush per peer
+            for peer_obj in self.peers:
+                if peer_obj.outbox:
+                    peer_obj.flush_outbox()
+
     def _cleanup_dead_peers(self):
         """Remove peers that are no longer healthy"""
         initial_count = len(self.peers)
@@ -144,7 +177,9 @@ class PeersManager(Thread):
         """Perform handshake with peer"""
         try:
             handshake = message.Handshake(self.torrent.info_hash, self.torrent.peer_id)
-            peer_obj.send_to_peer(handshake.to_bytes())
+            # Interested follows immediately in add_peer; let the kernel
+            # pack both into one segment
+            peer_obj.send_to_peer(handshake.to_bytes(), more=True)
             logging.info(f"Sent handshake to {peer_obj.ip}")
             return True
         except Exception as e:
@@ -154,14 +189,21 @@ class PeersManager(Thread):
     def add_peer(self, peer_obj):
         """Add a new peer to manage"""
         # Check if peer already exists
-        for existing_peer in self.peers:
-            if (existing_peer.ip == peer_obj.ip and 
-                existing_peer.port == peer_obj.port):
-                logging.debug(f"Peer {peer_obj.ip} already exists, skipping")
-                return False
+        addr = (peer_obj._ip_int if peer_obj._ip_int is not None
+                else peer_obj.ip, peer_obj.port)
+        if addr in self._peer_addrs:
+            logging.debug(f"Peer {peer_obj.ip} already exists, skipping")
+            return False
 
         if self._do_handshake(peer_obj):
             self.peers.append(peer_obj)
+            self._peer_addrs.add(addr)
+            if peer_obj.socket:
+                try:
+                    self._peers_by_fd[peer_obj.socket.fileno()] = peer_obj
+                    self.selector.register(peer_obj.socket, selectors.EVENT_READ, peer_obj)
+                except (ValueError, KeyError, OSError) as e:
+                    logging.debug(f"Selector register failed for {peer_obj.ip}: {e}")
             logging.info(f"Added peer {peer_obj.ip}:{peer_obj.port}")
             
             # Send "Interested" message immediately after handshake
@@ -188,8 +230,16 @@ class PeersManager(Thread):
     def remove_peer(self, peer_obj):
         """Remove a peer"""
         if peer_obj in self.peers:
+            self._peer_addrs.discard(
+                (peer_obj._ip_int if peer_obj._ip_int is not None
+                 else peer_obj.ip, peer_obj.port))
             try:
                 if peer_obj.socket:
+                    try:
+                        self._peers_by_fd.pop(peer_obj.socket.fileno(), None)
+                        self.selector.unregister(peer_obj.socket)
+                    except (KeyError, ValueError, OSError):
+                        pass
                     peer_obj.socket.close()
             except Exception as e:
                 logging.debug(f"Error closing socket for {peer_obj.ip}: {e}")
@@ -201,6 +251,13 @@ class PeersManager(Thread):
 
     def get_peer_by_socket(self, sock):
         """Find peer by socket"""
+        try:
+            peer_obj = self._peers_by_fd.get(sock.fileno())
+        except OSError:
+            peer_obj = None
+        if peer_obj is not None:
+            return peer_obj
+        # Closed or never-registered sockets fall back to the scan
         for peer_obj in self.peers:
             if peer_obj.socket == sock:
                 return peer_obj
@@ -213,81 +270,95 @@ class PeersManager(Thread):
                 return peer_obj
         return None
 
+    def _on_ignored_message(self, new_message, peer_obj):
+        logging.debug(f"Handshake or KeepAlive from {peer_obj.ip}")
+
+    def _on_choke(self, new_message, peer_obj):
+        peer_obj.handle_choke()
+        logging.info(f"Peer {peer_obj.ip} CHOKED us")
+
+    def _on_unchoke(self, new_message, peer_obj):
+        peer_obj.handle_unchoke()
+        logging.info(f"\U0001f389 Peer {peer_obj.ip} UNCHOKED us! Ready to download!")
+
+    def _on_interested(self, new_message, peer_obj):
+        peer_obj.handle_interested()
+        logging.debug(f"Peer {peer_obj.ip} is interested in our pieces")
+
+    def _on_not_interested(self, new_message, peer_obj):
+        peer_obj.handle_not_interested()
+        logging.debug(f"Peer {peer_obj.ip} is not interested")
+
+    def _on_have(self, new_message, peer_obj):
+        peer_obj.handle_have(new_message)
+        logging.debug("Peer %s has piece %s", peer_obj.ip, new_message.piece_index)
+
+        # Update rarest pieces if available
+        if hasattr(self.pieces_manager, 'rarest_pieces'):
+            self.pieces_manager.rarest_pieces.update_peer_bitfield(
+                peer_obj.bit_field, peer_obj
+            )
+
+    def _on_bitfield(self, new_message, peer_obj):
+        peer_obj.handle_bitfield(new_message)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(f"Peer {peer_obj.ip} sent bitfield with {peer_obj.get_available_pieces_count()} pieces")
+
+        # Update rarest pieces
+        if hasattr(self.pieces_manager, 'rarest_pieces'):
+            self.pieces_manager.rarest_pieces.update_peer_bitfield(
+                peer_obj.bit_field, peer_obj
+            )
+
+    def _on_request(self, new_message, peer_obj):
+        try:
+            peer_obj.handle_request(new_message)
+            logging.debug(f"Peer {peer_obj.ip} requested piece {new_message.piece_index}")
+        finally:
+            new_message.release()
+
+    def _on_piece(self, new_message, peer_obj):
+        try:
+            # Handle piece data - send to pieces manager
+            piece_data = peer_obj.handle_piece(new_message)
+            if piece_data:
+                # Track that we received data from this peer - UPDATE PEER SCORE!
+                piece_index, block_offset, block_data = piece_data
+                bytes_received = len(block_data)
+
+                # Update peer score - we received data from this peer!
+                if hasattr(self.pieces_manager, 'peer_scorer'):
+                    self.pieces_manager.peer_scorer.update_peer_score(
+                        hash(peer_obj),
+                        bytes_received=bytes_received
+                    )
+                    logging.debug("\U0001f4e5 Received %s bytes from %s (piece %s)",
+                                  bytes_received, peer_obj.ip, piece_index)
+
+                self.pieces_manager.receive_block_piece(piece_data)
+        finally:
+            # Block is copied at piece.set_block, so the message can go
+            # back to the parse freelist; on error too, or its view would
+            # pin the read buffer and turn the next recv append into a
+            # fatal BufferError for this peer
+            new_message.release()
+
+    def _on_cancel(self, new_message, peer_obj):
+        peer_obj.handle_cancel(new_message)
+        logging.debug(f"Peer {peer_obj.ip} canceled request")
+
+    def _on_port(self, new_message, peer_obj):
+        peer_obj.handle_port(new_message)
+        logging.debug(f"Peer {peer_obj.ip} sent port message")
+
     def _process_new_message(self, new_message, peer_obj):
         """Process incoming message from peer with peer scoring"""
         try:
-            if isinstance(new_message, message.Handshake) or isinstance(new_message, message.KeepAlive):
-                logging.debug(f"Handshake or KeepAlive from {peer_obj.ip}")
-                
-            elif isinstance(new_message, message.Choke):
-                peer_obj.handle_choke()
-                logging.info(f"Peer {peer_obj.ip} CHOKED us")
-                
-            elif isinstance(new_message, message.UnChoke):
-                peer_obj.handle_unchoke()
-                logging.info(f"🎉 Peer {peer_obj.ip} UNCHOKED us! Ready to download!")
-                
-            elif isinstance(new_message, message.Interested):
-                peer_obj.handle_interested()
-                logging.debug(f"Peer {peer_obj.ip} is interested in our pieces")
-                
-            elif isinstance(new_message, message.NotInterested):
-                peer_obj.handle_not_interested()
-                logging.debug(f"Peer {peer_obj.ip} is not interested")
-                
-            elif isinstance(new_message, message.Have):
-                peer_obj.handle_have(new_message)
-                logging.debug(f"Peer {peer_obj.ip} has piece {new_message.piece_index}")
-                
-                # Update rarest pieces if available
-                if hasattr(self.pieces_manager, 'rarest_pieces'):
-                    self.pieces_manager.rarest_pieces.update_peer_bitfield(
-                        peer_obj.bit_field, peer_obj
-                    )
-                
-            elif isinstance(new_message, message.BitField):
-                peer_obj.handle_bitfield(new_message)
-                logging.info(f"Peer {peer_obj.ip} sent bitfield with {peer_obj.bit_field.count(1)} pieces")
-                
-                # Update rarest pieces
-                if hasattr(self.pieces_manager, 'rarest_pieces'):
-                    self.pieces_manager.rarest_pieces.update_peer_bitfield(
-                        peer_obj.bit_field, peer_obj
-                    )
-                
-            elif isinstance(new_message, message.Request):
-                peer_obj.handle_request(new_message)
-                logging.debug(f"Peer {peer_obj.ip} requested piece {new_message.piece_index}")
-                
-            elif isinstance(new_message, message.Piece):
-                # Handle piece data - send to pieces manager
-                piece_data = peer_obj.handle_piece(new_message)
-                if piece_data:
-                    # Track that we received data from this peer - UPDATE PEER SCORE!
-                    piece_index, block_offset, block_data = piece_data
-                    bytes_received = len(block_data)
-                    
-                    # Update peer score - we received data from this peer!
-                    if hasattr(self.pieces_manager, 'peer_scorer'):
-                        self.pieces_manager.peer_scorer.update_peer_score(
-                            hash(peer_obj), 
-                            bytes_received=bytes_received
-                        )
-                        logging.debug(f"📥 Received {bytes_received} bytes from {peer_obj.ip} (piece {piece_index})")
-                    
-                    self.pieces_manager.receive_block_piece(piece_data)
-                
-            elif isinstance(new_message, message.Cancel):
-                peer_obj.handle_cancel()
-                logging.debug(f"Peer {peer_obj.ip} canceled request")
-                
-            elif isinstance(new_message, message.Port):
-                peer_obj.handle_port_request()
-                logging.debug(f"Peer {peer_obj.ip} sent port message")
-                
-            else:
+            handler = self._message_handlers.get(type(new_message))
+            if handler is None:
                 logging.warning(f"Unknown message type from {peer_obj.ip}: {type(new_message).__name__}")
-                
+                return
+            handler(new_message, peer_obj)
         except Exception as e:
             logging.error(f"Error processing message from {peer_obj.ip}: {e}")
             # Don't remove peer for message processing errors
@@ -324,7 +395,7 @@ class PeersManager(Thread):
                 if peer_obj.is_interested(): states.append("📥 Peer-Interested")
                 
                 status = " | ".join(states) if states else "❓ Unknown"
-                piece_count = peer_obj.bit_field.count(1) if hasattr(peer_obj, 'bit_field') else 0
+                piece_count = peer_obj.get_available_pieces_count() if hasattr(peer_obj, 'bit_field') else 0
                 logging.info(f"  {i+1}. {peer_obj.ip}:{peer_obj.port} - {status} - {piece_count} pieces")
             else:
                 logging.info(f"  {i+1}. {peer_obj.ip}:{peer_obj.port} - ❌ Unhealthy")
@@ -338,9 +409,16 @@ class PeersManager(Thread):
         for peer_obj in self.peers:
             try:
                 if peer_obj.socket:
+                    try:
+                        self.selector.unregister(peer_obj.socket)
+                    except (KeyError, ValueError):
+                        pass
                     peer_obj.socket.close()
             except Exception as e:
                 logging.debug(f"Error closing socket for {peer_obj.ip}: {e}")
         
         self.peers.clear()
+        self._peer_addrs.clear()
+        self._peers_by_fd.clear()
+        self.selector.close()
         logging.info("PeersManager stopped and all peers cleaned up")
\ No newline at end of file
@@ -44,6 +44,7 @@ class Piece:
                     if block.data:
                         logging.debug(f"Resetting pending block {i} in piece {self.piece_index} with data")
                     self.blocks[i] = Block(block_size=block.block_size)
+                    self._empty_block_cursor = min(self._empty_block_cursor, i)
                     reset_count += 1
         
         if reset_count > 0:
@@ -75,6 +76,11 @@ class Piece:
 
         # Only set if block is not already full
         if block.state != State.FULL:
+            # Storage boundary: copy out of any transport-buffer view here
+            # so the peer's read buffer can be recycled underneath it
+            if not isinstance(data, bytes):
+                data = bytes(data)
+
             # Validate data size matches block size (allow for last block being smaller)
             expected_size = block.block_size
             if len(data) != expected_size:
@@ -130,6 +136,23 @@ class Piece:
 
         return None
 
+    def pick_empty_block(self):
+        """Fast path for request scheduling: resume the free-block scan
+        where the previous call left off instead of starting at block 0"""
+        if self.is_full:
+            return None
+
+        blocks = self.blocks
+        for block_index in range(self._empty_block_cursor, len(blocks)):
+            block = blocks[block_index]
+            if block.state == State.FREE:
+                self._empty_block_cursor = block_index + 1
+                return self._prepare_block_request(block_index, block)
+
+        self._empty_block_cursor = len(blocks)
+        # Full scan fallback also picks up stale pending blocks
+        return self.get_empty_block()
+
     def _prepare_block_request(self, block_index: int, block: Block):
         """Prepare a block request and mark it as pending"""
         block_offset = block_index * BLOCK_SIZE
@@ -165,19 +188,27 @@ class Piece:
             logging.debug(f"Piece {self.piece_index} not ready for completion: blocks not all full")
             return False
 
-        # Merge all blocks into single piece data
-        data = self._merge_blocks()
-        
+        # Hash the blocks in a streaming pass so a corrupt piece is
+        # rejected before paying for the merged copy
+        sha1 = hashlib.sha1()
+        total_size = 0
+        for block in self.blocks:
+            sha1.update(block.data)
+            total_size += len(block.data)
+
         # Validate piece size
-        if len(data) != self.piece_size:
-            logging.error(f"Piece {self.piece_index} size mismatch: expected {self.piece_size}, got {len(data)}")
+        if total_size != self.piece_size:
+            logging.error(f"Piece {self.piece_index} size mismatch: expected {self.piece_size}, got {total_size}")
             self._handle_corruption()
             return False
-        
+
         # Verify piece hash
-        if not self._valid_blocks(data):
+        if sha1.digest() != self.piece_hash:
+            logging.warning(f"Piece {self.piece_index} hash mismatch")
+            logging.warning(f"  Expected: {self.piece_hash.hex()}")
+            logging.warning(f"  Actual:   {sha1.hexdigest()}")
             self.hash_verification_count += 1
-            
+
             # Allow one retry in case of temporary corruption
             if self.hash_verification_count <= 1:
                 logging.warning(f"Piece {self.piece_index} hash mismatch, attempt {self.hash_verification_count}")
@@ -188,9 +219,9 @@ class Piece:
                 self._handle_corruption()
                 return False
 
-        # Mark as complete
+        # Mark as complete; merge only happens for verified pieces
         self.is_full = True
-        self.raw_data = data
+        self.raw_data = self._merge_blocks()
         self.completion_time = time.time()
         download_time = self.completion_time - self.creation_time
         
@@ -208,6 +239,7 @@ class Piece:
     def _init_blocks(self):
         """Initialize blocks for this piece with proper sizing"""
         self.blocks = []
+        self._empty_block_cursor = 0
         
         if self.number_of_blocks > 1:
             for i in range(self.number_of_blocks):
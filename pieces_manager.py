@@ -1,9 +1,19 @@
 import piece
 import bitstring
+import errno
 import logging
 import os
-import message 
+import message
+import queue
 import time
+import threading
+
+
+# Preallocate files with fallocate so the filesystem reserves contiguous
+# extents up front instead of allocating blocks per write into a sparse
+# file. Disable on filesystems that misbehave with fallocate (FUSE, some
+# network mounts); creation then falls back to plain growth via pwrite.
+PREALLOCATE_FILES = True
 
 
 class PiecesManager:
@@ -14,9 +24,35 @@ class PiecesManager:
         self.pieces = self._generate_pieces()
         self.files = self._load_files()
         self.complete_pieces = 0
+        # File descriptors cached per path: opened once, written with
+        # pwrite, closed in close()
+        self._fds = {}
+        # Final size per path, for preallocation at first open
+        self._file_lengths = {
+            f["path"]: f["length"]
+            for f in getattr(torrent, 'file_names', []) or []
+        }
         self.peer_scorer = None  # Will be set by main.py
         self.total_downloaded = 0
         self.start_time = time.time()
+        # Set whenever a block arrives so the main loop can wake early
+        # instead of sleeping out its full poll interval
+        self.download_event = threading.Event()
+
+        # Completed pieces are flushed by a background daemon so disk
+        # latency never stalls the thread draining peer sockets
+        self._write_queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._disk_writer, daemon=True, name='piece-writer')
+        self._writer_thread.start()
+
+        # Maintained incrementally so piece pickers and progress reporting
+        # never have to rescan the full piece list
+        self.incomplete_indices = {i for i, p in enumerate(self.pieces) if not p.is_full}
+        self.downloaded_bytes = sum(p.piece_size for p in self.pieces if p.is_full)
+        # Same information as incomplete_indices, as one big int (bit i set =
+        # piece i still needed) for bitwise intersection with peer bitmasks
+        self.incomplete_mask = sum(1 << i for i in self.incomplete_indices)
 
         # Validate piece count
         if len(self.pieces) != self.number_of_pieces:
@@ -85,6 +121,7 @@ class PiecesManager:
         # Update the block
         piece_obj.set_block(block_offset, block_data)
         self.total_downloaded += len(block_data)
+        self.download_event.set()
         print(f"🔍 Set block in piece {piece_index}")  # DEBUG
 
         # Check if piece is complete
@@ -93,7 +130,9 @@ class PiecesManager:
             if piece_obj.set_to_full():
                 self.complete_pieces += 1
                 self.update_bitfield(piece_index)
-                self._write_piece_to_disk(piece_index)
+                # Hand the piece to the writer thread; its raw_data is
+                # immutable from here on
+                self._write_queue.put(piece_index)
                 
                 # Update rarest pieces if available
                 if hasattr(self, 'rarest_pieces'):
@@ -108,6 +147,10 @@ class PiecesManager:
         """Update bitfield when piece is completed"""
         if 0 <= piece_index < len(self.bitfield):
             self.bitfield[piece_index] = 1
+            if piece_index in self.incomplete_indices:
+                self.incomplete_indices.discard(piece_index)
+                self.incomplete_mask &= ~(1 << piece_index)
+                self.downloaded_bytes += self.pieces[piece_index].piece_size
             logging.debug(f"Updated bitfield: piece {piece_index} completed")
 
     def get_block(self, piece_index: int, block_offset: int, block_length: int) -> bytes:
@@ -230,6 +273,65 @@ class PiecesManager:
         logging.info(f"Mapped {len(files)} file segments to pieces")
         return files
 
+    def _get_fd(self, path):
+        """Return a cached read-write fd for path, opening (and creating)
+        the file on first use"""
+        fd = self._fds.get(path)
+        if fd is None:
+            dir_path = os.path.dirname(path)
+            if dir_path and not os.path.exists(dir_path):
+                os.makedirs(dir_path, exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            if PREALLOCATE_FILES:
+                self._preallocate(fd, path)
+            # Writer thread and main thread may race the first open for
+            # a path; keep whichever fd landed first
+            existing = self._fds.setdefault(path, fd)
+            if existing != fd:
+                os.close(fd)
+                fd = existing
+        return fd
+
+    def _preallocate(self, fd, path):
+        """Reserve the file's final size in one go so later pwrites hit
+        already-allocated extents"""
+        length = self._file_lengths.get(path, 0)
+        try:
+            if length > 0 and os.fstat(fd).st_size < length:
+                os.posix_fallocate(fd, 0, length)
+        except OSError as e:
+            if e.errno == errno.EOPNOTSUPP:
+                # Filesystem can't reserve extents; at least set the size
+                try:
+                    os.ftruncate(fd, length)
+                except OSError as e2:
+                    logging.debug(f"ftruncate failed for {path}: {e2}")
+            else:
+                logging.debug(f"Preallocation failed for {path}: {e}")
+
+    def _disk_writer(self):
+        """Drain the write queue on the background thread"""
+        while True:
+            piece_index = self._write_queue.get()
+            if piece_index is None:
+                break
+            try:
+                self._write_piece_to_disk(piece_index)
+            except Exception as e:
+                logging.error(f"Background write failed for piece {piece_index}: {e}")
+
+    def close(self):
+        """Flush pending writes and close all cached file descriptors"""
+        if self._writer_thread.is_alive():
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=10)
+        for path, fd in self._fds.items():
+            try:
+                os.close(fd)
+            except OSError as e:
+                logging.debug(f"Error closing {path}: {e}")
+        self._fds.clear()
+
     def _write_piece_to_disk(self, piece_index: int):
         """Write completed piece to disk with error handling"""
         if piece_index >= len(self.pieces):
@@ -251,24 +353,12 @@ class PiecesManager:
             length = file_info["length"]
 
             try:
-                # Create directory if needed
-                dir_path = os.path.dirname(path)
-                if dir_path and not os.path.exists(dir_path):
-                    os.makedirs(dir_path, exist_ok=True)
-                
-                # Check if file exists, if not create it
-                if not os.path.exists(path):
-                    with open(path, 'wb') as f:
-                        # Create empty file with correct size
-                        f.seek(file_offset + length - 1)
-                        f.write(b'\x00')
-                
-                # Write to file
-                with open(path, 'r+b') as f:
-                    f.seek(file_offset)
-                    data_to_write = piece_obj.raw_data[piece_offset:piece_offset + length]
-                    f.write(data_to_write)
-                    
+                # One positioned write from the cached fd: no per-piece
+                # open/seek/close round trip
+                fd = self._get_fd(path)
+                data_to_write = piece_obj.raw_data[piece_offset:piece_offset + length]
+                os.pwrite(fd, data_to_write, file_offset)
+
                 successful_writes += 1
                 logging.debug(f"Written {length} bytes to {path} at offset {file_offset}")
                     
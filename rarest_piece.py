@@ -1,6 +1,7 @@
 import logging
 import heapq
 import time
+import numpy as np
 
 
 class RarestPieces:
@@ -18,7 +19,7 @@ class RarestPieces:
         """Initialize all pieces with efficient data structures"""
         self.rarest_pieces = []
         self.piece_info_map = {}
-        
+
         for piece_index in range(self.pieces_manager.number_of_pieces):
             piece_info = {
                 "piece_index": piece_index,
@@ -26,27 +27,38 @@ class RarestPieces:
                 "peers": set(),  # Use set for O(1) lookups
                 "last_accessed": time.time()
             }
-            
-            # Add to both structures
-            heapq.heappush(self.rarest_pieces, (piece_info["number_of_peers"], piece_index, piece_info))
+
+            # Heap entries are (peer_count, piece_index); stale entries are
+            # discarded lazily when their count no longer matches the map
+            heapq.heappush(self.rarest_pieces, (0, piece_index))
             self.piece_info_map[piece_index] = piece_info
 
     def update_peer_bitfield(self, bitfield, peer):
         """Update piece availability when peer bitfield changes"""
-        if not bitfield or len(bitfield) != self.pieces_manager.number_of_pieces:
+        if bitfield is None or len(bitfield) != self.pieces_manager.number_of_pieces:
             logging.warning(f"Invalid bitfield length from peer {peer.ip}")
             return
 
+        # Touch only the set bits, instead of a Python-level test per
+        # piece. Peer bitfields are byte-per-piece uint8 arrays; anything
+        # else is treated as packed wire bits
+        if isinstance(bitfield, np.ndarray):
+            set_bits = np.flatnonzero(bitfield)
+        else:
+            raw = bitfield.tobytes() if hasattr(bitfield, 'tobytes') else bytes(bitfield)
+            set_bits = np.flatnonzero(np.unpackbits(np.frombuffer(raw, dtype=np.uint8)))
+
+        pieces = self.pieces_manager.pieces
+        number_of_pieces = self.pieces_manager.number_of_pieces
         updated_pieces = 0
-        for piece_index in range(min(len(bitfield), self.pieces_manager.number_of_pieces)):
+        for piece_index in set_bits.tolist():
+            if piece_index >= number_of_pieces:
+                break
             # Skip completed pieces
-            if (piece_index >= len(self.pieces_manager.pieces) or 
-                self.pieces_manager.pieces[piece_index].is_full):
+            if piece_index >= len(pieces) or pieces[piece_index].is_full:
                 continue
-                
-            if bitfield[piece_index]:
-                if self._add_peer_to_piece(piece_index, peer):
-                    updated_pieces += 1
+            if self._add_peer_to_piece(piece_index, peer):
+                updated_pieces += 1
 
         if updated_pieces > 0:
             logging.debug(f"Updated {updated_pieces} pieces for peer {peer.ip}")
@@ -64,10 +76,13 @@ class RarestPieces:
             old_count = piece_info["number_of_peers"]
             piece_info["number_of_peers"] = len(piece_info["peers"])
             piece_info["last_accessed"] = time.time()
-            
-            # If count changed, we need to re-heapify (done lazily in get_rarest_piece)
-            return old_count != piece_info["number_of_peers"]
-        
+
+            if old_count != piece_info["number_of_peers"]:
+                # Push a fresh heap entry; the stale one is dropped lazily
+                heapq.heappush(self.rarest_pieces,
+                               (piece_info["number_of_peers"], piece_index))
+                return True
+
         return False
 
     def remove_peer_from_all_pieces(self, peer):
@@ -77,8 +92,12 @@ class RarestPieces:
             if peer in piece_info["peers"]:
                 piece_info["peers"].discard(peer)
                 piece_info["number_of_peers"] = len(piece_info["peers"])
+                if piece_info["number_of_peers"] > 0:
+                    heapq.heappush(self.rarest_pieces,
+                                   (piece_info["number_of_peers"],
+                                    piece_info["piece_index"]))
                 removed_count += 1
-        
+
         if removed_count > 0:
             logging.debug(f"Removed peer {peer.ip} from {removed_count} pieces")
 
@@ -102,39 +121,43 @@ class RarestPieces:
         self._optimize_if_needed()
 
         excluded_set = set(excluded_pieces) if excluded_pieces else set()
-        
-        # Create temporary min-heap with only available pieces
-        available_pieces = []
-        for piece_info in self.piece_info_map.values():
-            piece_index = piece_info["piece_index"]
-            
-            # Skip if completed, being downloaded, or excluded
-            if (piece_info.get("completed") or 
-                piece_index in excluded_set or
+
+        # Pop lazily-invalidated entries until a live one surfaces
+        held_back = []
+        result = None
+        while self.rarest_pieces:
+            count, piece_index = heapq.heappop(self.rarest_pieces)
+            piece_info = self.piece_info_map.get(piece_index)
+
+            # Discard stale entries (count changed since it was pushed)
+            if piece_info is None or count != piece_info["number_of_peers"]:
+                continue
+
+            # Discard completed or unavailable pieces permanently
+            if (count == 0 or
+                piece_info.get("completed") or
                 piece_index >= len(self.pieces_manager.pieces) or
                 self.pieces_manager.pieces[piece_index].is_full):
                 continue
-                
-            # Only consider pieces that have at least one peer
-            if piece_info["number_of_peers"] > 0:
-                heapq.heappush(available_pieces, 
-                             (piece_info["number_of_peers"], 
-                              piece_info["last_accessed"], 
-                              piece_index))
-
-        if available_pieces:
-            # Get the rarest piece (lowest peer count)
-            rarest_count, last_accessed, rarest_index = heapq.heappop(available_pieces)
-            
-            # Update access time
-            if rarest_index in self.piece_info_map:
-                self.piece_info_map[rarest_index]["last_accessed"] = time.time()
-            
-            logging.debug(f"Selected rarest piece {rarest_index} with {rarest_count} peers")
-            return rarest_index
-        
-        logging.debug("No available pieces found for download")
-        return None
+
+            if piece_index in excluded_set:
+                # Still valid, just not wanted this call
+                held_back.append((count, piece_index))
+                continue
+
+            # Keep the entry in the heap for the next call
+            heapq.heappush(self.rarest_pieces, (count, piece_index))
+            piece_info["last_accessed"] = time.time()
+            logging.debug(f"Selected rarest piece {piece_index} with {count} peers")
+            result = piece_index
+            break
+
+        for entry in held_back:
+            heapq.heappush(self.rarest_pieces, entry)
+
+        if result is None:
+            logging.debug("No available pieces found for download")
+        return result
 
     def get_rarest_pieces(self, count=5, excluded_pieces=None):
         """Get multiple rarest pieces for parallel downloading"""
@@ -161,10 +184,10 @@ class RarestPieces:
                     piece_index
                 ))
 
-        # Sort by rarity (lowest peer count first) then by recent access
-        available_pieces.sort(key=lambda x: (x[0], x[1]))
-        
-        result = [piece_index for _, _, piece_index in available_pieces[:count]]
+        # Pick by rarity (lowest peer count first) then by recent access,
+        # without sorting the pieces we are not going to return
+        result = [piece_index for _, _, piece_index
+                  in heapq.nsmallest(count, available_pieces)]
         
         # Update access times
         for piece_index in result:
@@ -182,13 +205,14 @@ class RarestPieces:
             self.last_optimization = current_time
 
     def _rebuild_heap(self):
-        """Rebuild the heap from scratch for efficiency"""
+        """Rebuild the heap from scratch to drop accumulated stale entries"""
         logging.debug("Rebuilding rarest pieces heap")
-        self.rarest_pieces = []
-        for piece_index, piece_info in self.piece_info_map.items():
-            if not piece_info.get("completed"):
-                heapq.heappush(self.rarest_pieces, 
-                             (piece_info["number_of_peers"], piece_index, piece_info))
+        self.rarest_pieces = [
+            (piece_info["number_of_peers"], piece_index)
+            for piece_index, piece_info in self.piece_info_map.items()
+            if not piece_info.get("completed")
+        ]
+        heapq.heapify(self.rarest_pieces)
 
     def get_piece_availability(self, piece_index):
         """Get availability information for a specific piece"""
@@ -12,12 +12,27 @@ from message import UdpTrackerConnection, UdpTrackerAnnounce, UdpTrackerAnnounce
 
 class SockAddr:
     def __init__(self, ip, port, allowed=True):
-        self.ip = ip
+        # ip is either a dotted-quad string or a packed 4-byte address;
+        # packed addresses stay packed until someone actually needs the
+        # string form (dialing or display)
+        if isinstance(ip, (bytes, bytearray, memoryview)):
+            self._packed = bytes(ip)
+            self._ip = None
+        else:
+            self._packed = None
+            self._ip = ip
         self.port = port
         self.allowed = allowed
 
+    @property
+    def ip(self):
+        if self._ip is None:
+            self._ip = socket.inet_ntoa(self._packed)
+        return self._ip
+
     def __hash__(self):
-        return hash((self.ip, self.port))
+        return hash((self._packed if self._packed is not None else self._ip,
+                     self.port))
 
     def __str__(self):
         return f"{self.ip}:{self.port}"
@@ -166,14 +181,12 @@ class Tracker:
         while offset + 6 <= len(peers_data):
             try:
                 ip_bytes = peers_data[offset:offset+4]
-                port_bytes = peers_data[offset+4:offset+6]
-                
-                ip = socket.inet_ntoa(ip_bytes)
-                port = struct.unpack(">H", port_bytes)[0]
-                
-                # Validate IP and port
-                if ip and 1 <= port <= 65535:
-                    sock_addr = SockAddr(ip, port)
+                port = struct.unpack_from(">H", peers_data, offset+4)[0]
+
+                # Keep the IP packed; SockAddr formats it lazily if the
+                # peer is ever dialed or displayed
+                if 1 <= port <= 65535:
+                    sock_addr = SockAddr(ip_bytes, port)
                     if hash(sock_addr) not in self.dict_sock_addr:
                         self.dict_sock_addr[hash(sock_addr)] = sock_addr
                         peer_count += 1